@@ -25,6 +25,10 @@ class TunnelBackend(Protocol):
 
     def kill_tunnel(self, name: str, session_name: str) -> bool: ...
 
+    def kill_tunnels(
+        self, names: list[str], session_name: str
+    ) -> dict[str, Exception | None]: ...
+
     def tunnel_exists(self, name: str, session_name: str) -> bool: ...
 
     def list_tunnels(self, session_name: str) -> list[TunnelInfo]: ...
@@ -25,15 +25,16 @@ class TmuxBackend:
     def kill_tunnel(self, name: str, session_name: str) -> bool:
         return _windows.kill_window(name, session_name)
 
+    def kill_tunnels(
+        self, names: list[str], session_name: str
+    ) -> dict[str, Exception | None]:
+        return _windows.kill_windows(names, session_name)
+
     def tunnel_exists(self, name: str, session_name: str) -> bool:
         return _windows.window_exists(name, session_name)
 
     def list_tunnels(self, session_name: str) -> list[TunnelInfo]:
-        raw_windows = _windows.list_windows(session_name)
-        return [
-            TunnelInfo(name=w["name"], status=w["status"], command=w["command"])
-            for w in raw_windows
-        ]
+        return _windows.list_windows(session_name)
 
     def get_tunnel_diagnostics(
         self, name: str, session_name: str
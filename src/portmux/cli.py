@@ -2,29 +2,60 @@
 
 from __future__ import annotations
 
+import importlib
+
 import click
-import colorama
 
-from . import __version__
-from .core.output import Output
+# Command name -> "module:attribute", imported on first use so that
+# `portmux --version` and single-command runs skip unrelated modules
+_LAZY_COMMANDS = {
+    "init": ".commands.init:init",
+    "status": ".commands.status:status",
+    "add": ".commands.add:add",
+    "list": ".commands.list:list",
+    "remove": ".commands.remove:remove",
+    "refresh": ".commands.refresh:refresh",
+    "profile": ".commands.profile:profile",
+    "watch": ".commands.watch:watch",
+    "monitor": ".commands.monitor:monitor",
+    "_monitor-daemon": ".commands.monitor:monitor_daemon",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are needed."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-# Initialize colorama for cross-platform colored output
-colorama.init()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option(
     "--session", "-s", default="portmux", help="Tmux session name (default: portmux)"
 )
 @click.option("--config", "-c", type=click.Path(), help="Path to config file")
-@click.version_option(version=__version__, prog_name="PortMUX")
+# Package metadata is only read when --version is given
+@click.version_option(package_name="portmux", prog_name="PortMUX")
 @click.pass_context
 def main(ctx: click.Context, verbose: bool, session: str, config: str | None):
     """PortMUX - Port Multiplexer and Manager for SSH forwards.
 
     Manage SSH port forwards through a persistent tmux session.
     """
+    from .core.output import Output
+
     # Ensure context object exists
     ctx.ensure_object(dict)
 
@@ -38,30 +69,5 @@ def main(ctx: click.Context, verbose: bool, session: str, config: str | None):
     ctx.obj["output"] = output
 
 
-# Import and register command modules
-from .commands import (  # noqa: E402
-    add,
-    init,
-    monitor,
-    profile,
-    refresh,
-    remove,
-    status,
-    watch,
-)
-from .commands import list as list_cmd  # noqa: E402
-
-main.add_command(init.init)
-main.add_command(status.status)
-main.add_command(add.add)
-main.add_command(list_cmd.list)
-main.add_command(remove.remove)
-main.add_command(refresh.refresh)
-main.add_command(profile.profile)
-main.add_command(watch.watch)
-main.add_command(monitor.monitor)
-main.add_command(monitor.monitor_daemon)
-
-
 if __name__ == "__main__":
     main()
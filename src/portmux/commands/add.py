@@ -12,18 +12,12 @@ from ..core.output import Output
 from ..core.service import PortmuxService
 from ..health import HealthChecker, TunnelHealth
 from ..models import ForwardInfo
-from ..utils import handle_error, validate_direction, validate_port_spec
+from ..utils import DIRECTION_CHOICE, PORT_SPEC, handle_error
 
 
 @click.command()
-@click.argument(
-    "direction",
-    callback=lambda ctx, _param, value: validate_direction(value) if value else value,
-)
-@click.argument(
-    "spec",
-    callback=lambda ctx, _param, value: validate_port_spec(value) if value else value,
-)
+@click.argument("direction", type=DIRECTION_CHOICE)
+@click.argument("spec", type=PORT_SPEC)
 @click.argument("host")
 @click.option("--identity", "-i", type=click.Path(), help="SSH identity file path")
 @click.option("--no-check", is_flag=True, help="Skip connectivity validation")
@@ -95,6 +89,7 @@ def add(
                 svc.logger.warning("Could not verify connection", tunnel=window_name)
             svc.logger.flush()
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
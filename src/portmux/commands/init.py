@@ -39,17 +39,23 @@ def init(ctx: click.Context, force: bool, profile: str, no_startup: bool):
     output: Output = ctx.obj.get("output") or Output()
 
     try:
-        # Load or create base configuration
-        output.verbose("Loading configuration...", verbose)
+        # Load or create base configuration; these messages arrive together,
+        # so emit them in a single write
+        with output.batch():
+            output.verbose("Loading configuration...", verbose)
+
+            # load_config falls back to defaults for a missing file, so check
+            # for the file up front rather than relying on a load failure
+            default_path = get_config_path()
+            if config_path is None and not default_path.exists():
+                output.verbose("Creating default configuration...", verbose)
+                create_default_config()
+                output.success(f"Default configuration created at {default_path}")
 
-        try:
             config = load_config(config_path)
-            output.verbose(f"Configuration loaded from {get_config_path()}", verbose)
-        except Exception:
-            output.verbose("Creating default configuration...", verbose)
-            create_default_config()
-            config = load_config(config_path)
-            output.success(f"Default configuration created at {get_config_path()}")
+            output.verbose(
+                f"Configuration loaded from {config_path or default_path}", verbose
+            )
 
         # Create service and delegate
         svc = PortmuxService(config, output, base_session_name)
@@ -70,5 +76,4 @@ def init(ctx: click.Context, force: bool, profile: str, no_startup: bool):
     except click.ClickException:
         raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
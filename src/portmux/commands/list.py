@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import sys
 
 import click
 
@@ -14,12 +15,14 @@ from ..utils import create_forwards_table, handle_error
 
 @click.command()
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
+@click.option("--pretty", is_flag=True, help="Indent JSON output (with --json)")
 @click.pass_context
-def list(ctx: click.Context, output_json: bool):
+def list(ctx: click.Context, output_json: bool, pretty: bool):
     """List all active SSH port forwards.
 
     Shows a table of all forwards with their direction and specification.
-    Use --json for machine-readable output suitable for scripting.
+    Use --json for compact machine-readable output suitable for scripting,
+    adding --pretty for indented JSON.
     Use 'portmux status' to see health check results.
     """
     session_name = ctx.obj["session"]
@@ -33,10 +36,9 @@ def list(ctx: click.Context, output_json: bool):
         # Check if session exists
         if not svc.session_is_active():
             if output_json:
-                click.echo(
-                    json.dumps(
-                        {"session": session_name, "active": False, "forwards": []}
-                    )
+                _write_json(
+                    {"session": session_name, "active": False, "forwards": []},
+                    pretty,
                 )
             else:
                 output.error(f"Session '{session_name}' is not active")
@@ -63,7 +65,7 @@ def list(ctx: click.Context, output_json: bool):
                 "active": True,
                 "forwards": forwards_data,
             }
-            click.echo(json.dumps(output_data, indent=2))
+            _write_json(output_data, pretty)
         else:
             # Human-readable table output
             if not forwards:
@@ -77,6 +79,13 @@ def list(ctx: click.Context, output_json: bool):
                 table = create_forwards_table(forwards, include_status=False)
                 output.table(table)
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
+
+
+def _write_json(data: dict, pretty: bool) -> None:
+    """Serialize data straight to stdout, compact unless pretty is set."""
+    json.dump(data, sys.stdout, indent=2 if pretty else None)
+    sys.stdout.write("\n")
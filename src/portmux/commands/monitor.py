@@ -55,9 +55,10 @@ def start(ctx: click.Context, interval: float | None):
 
         svc.start_background_monitor()
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 @monitor.command()
@@ -83,9 +84,10 @@ def stop(ctx: click.Context):
         svc.logger.info("Background monitor stopped")
         svc.logger.flush()
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 @monitor.command()
@@ -118,9 +120,10 @@ def status(ctx: click.Context):
             output.warning("Monitor: not running")
             output.info("Use 'portmux monitor start' to start it")
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 def _run_daemon(session_name: str, interval: float | None, config_path: str | None):
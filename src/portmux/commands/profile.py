@@ -50,7 +50,8 @@ def list(ctx: click.Context):
 
     try:
         config = load_config(config_path)
-        profiles = list_available_profiles(config)
+        summary = profile_summary(config)
+        profiles = summary["profile_names"]
 
         if not profiles:
             output.warning("No profiles configured")
@@ -66,28 +67,13 @@ def list(ctx: click.Context):
         table.add_column("Commands", style="yellow")
         table.add_column("Custom Identity", style="magenta")
 
-        summary = profile_summary(config)
-
-        for profile_name in profiles:
-            profile_data = summary["profiles"].get(profile_name, {})
-
-            if "error" in profile_data:
-                table.add_row(
-                    profile_name,
-                    "[red]Error[/red]",
-                    "[red]Error[/red]",
-                    "[red]Error[/red]",
-                )
-            else:
-                commands_count = str(profile_data.get("command_count", 0))
-                custom_identity = (
-                    "Yes" if profile_data.get("has_custom_identity", False) else "No"
-                )
-                session_name = profile_data.get("session_name", "portmux")
-
-                table.add_row(
-                    profile_name, session_name, commands_count, custom_identity
-                )
+        for profile_name, data in summary["profiles"].items():
+            table.add_row(
+                profile_name,
+                data["session_name"],
+                str(data["command_count"]),
+                "Yes" if data["has_custom_identity"] else "No",
+            )
 
         output.table(table)
 
@@ -97,9 +83,10 @@ def list(ctx: click.Context):
                 f"Configuration file: {config_path or '~/.portmux/config.toml'}"
             )
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 @profile.command()
@@ -160,9 +147,10 @@ def show(ctx: click.Context, profile_name: str):
             )
             output.info(f"Profile inherits identity: {info['inherits_identity']}")
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 @profile.command()
@@ -200,9 +188,10 @@ def active(ctx: click.Context):
                     "Use 'portmux init --profile <name>' to initialize with a profile"
                 )
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
 
 
 # Register the profile command group
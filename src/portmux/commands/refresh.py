@@ -6,20 +6,38 @@ import click
 
 from ..core.config import load_config
 from ..core.output import Output
-from ..core.service import PortmuxService
+from ..core.service import MAX_REFRESH_WORKERS, PortmuxService
+from ..exceptions import ForwardNotFoundError
 from ..utils import handle_error
 
 
 @click.command()
 @click.argument("name", required=False)
 @click.option("--all", "refresh_all", is_flag=True, help="Refresh all forwards")
-@click.option("--delay", type=float, help="Delay between kill and recreate (seconds)")
+@click.option(
+    "--delay",
+    type=float,
+    help="With --all, delay between refreshes on each worker (seconds)",
+)
+@click.option(
+    "--parallel",
+    "-j",
+    type=click.IntRange(1, MAX_REFRESH_WORKERS),
+    default=4,
+    show_default=True,
+    help="Number of forwards to refresh concurrently with --all",
+)
 @click.option(
     "--reload-startup", is_flag=True, help="Re-execute startup commands after refresh"
 )
 @click.pass_context
 def refresh(
-    ctx: click.Context, name: str, refresh_all: bool, delay: float, reload_startup: bool
+    ctx: click.Context,
+    name: str,
+    refresh_all: bool,
+    delay: float,
+    parallel: int,
+    reload_startup: bool,
 ):
     """Refresh SSH port forwards by recreating them.
 
@@ -36,6 +54,8 @@ def refresh(
 
         portmux refresh --all --delay 2       # Refresh with 2 second delay
 
+        portmux refresh --all -j 1            # Refresh one forward at a time
+
         portmux refresh --all --reload-startup # Refresh and re-run startup commands
     """
     session_name = ctx.obj["session"]
@@ -62,32 +82,33 @@ def refresh(
                 delay=delay,
                 reload_startup=reload_startup,
                 verbose=verbose,
+                parallel=parallel,
             )
             return
 
-        # Handle single forward refresh
-        forwards = svc.list_forwards()
-        forward_exists = any(f.name == name for f in forwards)
-        if not forward_exists:
-            output.error(f"Forward '{name}' not found")
-            output.info("Use 'portmux list' to see active forwards")
-            return
+        # Handle single forward refresh; refresh_forward looks the forward up
+        # itself, so the session isn't listed twice
 
         # Use config default delay if not specified
-        effective_delay = delay if delay is not None else config.reconnect_delay
+        default_delay = config.reconnect_delay
+        effective_delay = delay if delay is not None else default_delay
 
-        if verbose or (delay is not None and delay != config.reconnect_delay):
+        if verbose or (delay is not None and delay != default_delay):
             output.info(f"Refreshing forward '{name}' with {effective_delay}s delay...")
 
-        svc.refresh_forward(name, verbose=verbose)
+        try:
+            svc.refresh_forward(name, verbose=verbose)
+        except ForwardNotFoundError:
+            output.error(f"Forward '{name}' not found")
+            output.info("Use 'portmux list' to see active forwards")
+            return
         output.success(f"Successfully refreshed forward '{name}'")
 
         # Handle startup reload for single forward
         if reload_startup:
             svc.handle_startup_reload(verbose)
 
-    except click.UsageError:
+    except click.ClickException:
         raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
@@ -6,7 +6,6 @@ import click
 
 from ..core.config import load_config
 from ..core.output import Output
-from ..core.service import PortmuxService
 from ..utils import confirm_destructive_action, handle_error
 
 
@@ -43,6 +42,9 @@ def remove(
             raise click.UsageError("Must specify forward name or use --all flag")
 
         config = load_config(ctx.obj.get("config"))
+        # Deferred so `remove --help` doesn't import libtmux and the backend
+        from ..core.service import PortmuxService
+
         svc = PortmuxService(config, output, session_name)
 
         # Check if session exists
@@ -73,23 +75,22 @@ def remove(
             if confirm_destructive_action(
                 f"This will remove ALL {len(forwards)} forward(s). Continue?", force
             ):
-                svc.remove_all_forwards(verbose)
+                svc.remove_all_forwards(verbose, forwards=forwards)
             else:
                 output.warning("Operation cancelled")
             return
 
         # Handle single forward removal
-        forwards = svc.list_forwards()
-        forward_exists = any(f.name == name for f in forwards)
-        if not forward_exists:
+        forwards_by_name = {f.name: f for f in svc.list_forwards()}
+        forward = forwards_by_name.get(name)
+        if forward is None:
             output.error(f"Forward '{name}' not found")
             output.info("Use 'portmux list' to see active forwards")
             return
 
-        svc.remove_forward(name, verbose)
+        svc.remove_forward(name, verbose, forward=forward)
 
-    except click.UsageError:
+    except click.ClickException:
         raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
@@ -8,7 +8,6 @@ import click
 
 from ..core.config import load_config
 from ..core.output import Output
-from ..core.service import MONITOR_WINDOW, PortmuxService
 from ..health.logger import HealthLogger
 from ..utils import create_forwards_table, handle_error
 
@@ -26,6 +25,9 @@ def status(ctx: click.Context):
 
     try:
         config = load_config(ctx.obj.get("config"))
+        # Deferred so `status --help` doesn't import libtmux and the backend
+        from ..core.service import MONITOR_WINDOW, PortmuxService
+
         svc = PortmuxService(config, output, session_name)
 
         status_info = svc.get_status()
@@ -71,6 +73,7 @@ def status(ctx: click.Context):
                     " (use 'portmux watch --tail 20' to see all)"
                 )
 
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
@@ -57,6 +57,7 @@ def watch(ctx: click.Context, interval: float | None):
 
     except KeyboardInterrupt:
         output.info("\nMonitor stopped")
+    except click.ClickException:
+        raise
     except Exception as e:
-        handle_error(e, output)
-        raise click.ClickException(str(e))
+        raise handle_error(e)
@@ -2,30 +2,71 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
+import os
 from pathlib import Path
+from types import MappingProxyType
 
-import toml
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+import tomli_w
 
 from ..exceptions import ConfigError
 from ..models import MonitorConfig, PortmuxConfig, ProfileConfig, StartupConfig
 
-DEFAULT_CONFIG = {
-    "session_name": "portmux",
-    "default_identity": None,
-    "reconnect_delay": 1,
-    "max_retries": 3,
-}
+# Read-only templates; copy them (with a fresh "commands" list) before use
+DEFAULT_CONFIG = MappingProxyType(
+    {
+        "session_name": "portmux",
+        "default_identity": None,
+        "reconnect_delay": 1,
+        "max_retries": 3,
+        "control_master": False,
+    }
+)
+
+DEFAULT_STARTUP_CONFIG = MappingProxyType(
+    {
+        "auto_execute": True,
+        "commands": [],
+    }
+)
+
+DEFAULT_PROFILE_CONFIG = MappingProxyType(
+    {
+        "session_name": None,
+        "default_identity": None,
+        "commands": [],
+    }
+)
 
-DEFAULT_STARTUP_CONFIG = {
-    "auto_execute": True,
-    "commands": [],
-}
+# Written by create_default_config on first run; values mirror the
+# PortmuxConfig dataclass defaults
+_DEFAULT_CONFIG_TEMPLATE = """\
+# PortMUX configuration; see config.toml.example for all options
 
-DEFAULT_PROFILE_CONFIG = {
-    "session_name": None,
-    "default_identity": None,
-    "commands": [],
-}
+[general]
+session_name = "portmux"
+{identity_line}
+reconnect_delay = 1
+max_retries = 3
+control_master = false
+
+[startup]
+auto_execute = true
+commands = []
+
+[monitor]
+enabled = true
+check_interval = 30.0
+tcp_timeout = 2.0
+auto_reconnect = true
+"""
 
 
 def get_config_path() -> Path:
@@ -41,6 +82,9 @@ def get_config_path() -> Path:
 def load_config(config_path: str | None = None) -> PortmuxConfig:
     """Load configuration from TOML file.
 
+    Parsed configs are cached per process, keyed on the file's modification
+    time and size, so repeated loads are cheap and edits are still picked up.
+
     Args:
         config_path: Path to config file (optional, uses default if None)
 
@@ -53,23 +97,43 @@ def load_config(config_path: str | None = None) -> PortmuxConfig:
     if config_path is None:
         config_file = get_config_path()
     else:
-        config_file = Path(config_path).expanduser()
+        # Absolute so the cache key still names the same file if cwd changes
+        config_file = Path(config_path).expanduser().absolute()
 
+    try:
+        stat = config_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+
+    # Hand out a copy so callers can't mutate the cached instance
+    return copy.deepcopy(_load_config_cached(config_file, stamp))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    config_file: Path, stamp: tuple[int, int] | None
+) -> PortmuxConfig:
+    """Parse and validate a config file.
+
+    ``stamp`` keys the cache; None means the file could not be stat'ed.
+    """
     # Start with default config structure
     config = {
         "general": DEFAULT_CONFIG.copy(),
-        "startup": DEFAULT_STARTUP_CONFIG.copy(),
+        "startup": {**DEFAULT_STARTUP_CONFIG, "commands": []},
         "profiles": {},
     }
 
-    # If config file doesn't exist, return defaults
-    if not config_file.exists():
+    # If config file doesn't exist, return defaults; load_config already
+    # stat'ed it, so don't check again
+    if stamp is None:
         return _build_config(config)
 
     try:
         # Load configuration from file
-        with open(config_file) as f:
-            file_config = toml.load(f)
+        with open(config_file, "rb") as f:
+            file_config = tomllib.load(f)
 
         # Handle both new structured format and legacy flat format
         if (
@@ -103,7 +167,7 @@ def load_config(config_path: str | None = None) -> PortmuxConfig:
 
         return _build_config(config)
 
-    except toml.TomlDecodeError as e:
+    except tomllib.TOMLDecodeError as e:
         raise ConfigError(f"Invalid TOML in config file '{config_file}': {e}")
     except OSError as e:
         raise ConfigError(f"Failed to read config file '{config_file}': {e}")
@@ -129,6 +193,7 @@ def _build_config(raw: dict) -> PortmuxConfig:
         default_identity=general.get("default_identity"),
         reconnect_delay=general.get("reconnect_delay", 1),
         max_retries=general.get("max_retries", 3),
+        control_master=general.get("control_master", False),
         startup=StartupConfig(
             auto_execute=startup_raw.get("auto_execute", True),
             commands=list(startup_raw.get("commands", [])),
@@ -169,8 +234,8 @@ def save_config(config: PortmuxConfig, config_path: str | None = None) -> None:
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Save config to file
-        with open(config_file, "w") as f:
-            toml.dump(toml_dict, f)
+        with open(config_file, "wb") as f:
+            tomli_w.dump(toml_dict, f)
 
     except OSError as e:
         raise ConfigError(f"Failed to save config file '{config_file}': {e}")
@@ -181,11 +246,14 @@ def _config_to_toml_dict(config: PortmuxConfig) -> dict:
     toml_dict: dict = {
         "general": {
             "session_name": config.session_name,
-            "default_identity": config.default_identity,
             "reconnect_delay": config.reconnect_delay,
             "max_retries": config.max_retries,
+            "control_master": config.control_master,
         },
     }
+    # TOML has no null; an unset identity is simply left out
+    if config.default_identity is not None:
+        toml_dict["general"]["default_identity"] = config.default_identity
 
     toml_dict["startup"] = {
         "auto_execute": config.startup.auto_execute,
@@ -214,21 +282,29 @@ def _config_to_toml_dict(config: PortmuxConfig) -> dict:
     return toml_dict
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_identity() -> str | None:
     """Get path to default SSH identity file.
 
+    The lookup is cached for the life of the process; a key created after
+    the first call is only picked up by the next invocation.
+
     Returns:
         Path to default SSH key or None if not found
     """
     ssh_dir = Path.home() / ".ssh"
 
-    # Common identity file names in order of preference
-    identity_files = ["id_ed25519", "id_rsa", "id_ecdsa", "id_dsa"]
+    # One directory read instead of a stat per candidate
+    try:
+        with os.scandir(ssh_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
 
-    for filename in identity_files:
-        identity_path = ssh_dir / filename
-        if identity_path.exists():
-            return str(identity_path)
+    # Common identity file names in order of preference
+    for filename in ("id_ed25519", "id_rsa", "id_ecdsa", "id_dsa"):
+        if filename in present:
+            return str(ssh_dir / filename)
 
     return None
 
@@ -262,14 +338,17 @@ def validate_config(config: dict) -> bool:
         startup_config = config.get("startup", {})
         profiles_config = config.get("profiles", {})
 
+    # Profiles often share one key; stat each identity path only once
+    identity_exists: dict[str, bool] = {}
+
     # Validate general configuration
-    _validate_general_config(general_config)
+    _validate_general_config(general_config, identity_exists)
 
     # Validate startup configuration
     _validate_startup_config(startup_config)
 
     # Validate profiles configuration
-    _validate_profiles_config(profiles_config)
+    _validate_profiles_config(profiles_config, identity_exists)
 
     # Validate monitor configuration
     monitor_config = config.get("monitor", {})
@@ -278,7 +357,29 @@ def validate_config(config: dict) -> bool:
     return True
 
 
-def _validate_general_config(config: dict) -> bool:
+def identity_file_exists(identity: str, seen: dict[str, bool] | None = None) -> bool:
+    """Check whether an SSH identity file exists.
+
+    Nothing is cached between calls. Callers validating many entries pass
+    their own ``seen`` dict, which lives only as long as that validation.
+
+    Args:
+        identity: Path to the identity file (``~`` is expanded)
+        seen: Results of earlier checks to reuse and fill in (optional)
+
+    Returns:
+        True if the file exists
+    """
+    if seen is None:
+        return Path(identity).expanduser().exists()
+    if identity not in seen:
+        seen[identity] = Path(identity).expanduser().exists()
+    return seen[identity]
+
+
+def _validate_general_config(
+    config: dict, identity_exists: dict[str, bool] | None = None
+) -> bool:
     """Validate general configuration section."""
     required_keys = ["session_name"]
 
@@ -289,7 +390,7 @@ def _validate_general_config(config: dict) -> bool:
 
     # Validate session_name
     session_name = config.get("session_name")
-    if not isinstance(session_name, str) or not session_name.strip():
+    if not isinstance(session_name, str) or not session_name or session_name.isspace():
         raise ConfigError("'session_name' must be a non-empty string")
 
     # Validate default_identity if provided
@@ -298,8 +399,7 @@ def _validate_general_config(config: dict) -> bool:
         if not isinstance(default_identity, str):
             raise ConfigError("'default_identity' must be a string or None")
 
-        identity_path = Path(default_identity).expanduser()
-        if not identity_path.exists():
+        if not identity_file_exists(default_identity, identity_exists):
             raise ConfigError(f"Default identity file not found: '{default_identity}'")
 
     # Validate reconnect_delay
@@ -312,6 +412,11 @@ def _validate_general_config(config: dict) -> bool:
     if not isinstance(max_retries, int) or max_retries < 0:
         raise ConfigError("'max_retries' must be a non-negative integer")
 
+    # Validate control_master
+    control_master = config.get("control_master", False)
+    if not isinstance(control_master, bool):
+        raise ConfigError("'control_master' must be a boolean")
+
     return True
 
 
@@ -334,13 +439,15 @@ def _validate_startup_config(config: dict) -> bool:
     for i, command in enumerate(commands):
         if not isinstance(command, str):
             raise ConfigError(f"'startup.commands[{i}]' must be a string")
-        if not command.strip():
+        if not command or command.isspace():
             raise ConfigError(f"'startup.commands[{i}]' cannot be empty")
 
     return True
 
 
-def _validate_profiles_config(config: dict) -> bool:
+def _validate_profiles_config(
+    config: dict, identity_exists: dict[str, bool] | None = None
+) -> bool:
     """Validate profiles configuration section."""
     if not config:
         return True  # Empty profiles config is valid
@@ -350,23 +457,35 @@ def _validate_profiles_config(config: dict) -> bool:
 
     # Validate each profile
     for profile_name, profile_config in config.items():
-        if not isinstance(profile_name, str) or not profile_name.strip():
+        if (
+            not isinstance(profile_name, str)
+            or not profile_name
+            or profile_name.isspace()
+        ):
             raise ConfigError("Profile names must be non-empty strings")
 
         if not isinstance(profile_config, dict):
             raise ConfigError(f"Profile '{profile_name}' must be a dictionary")
 
-        _validate_profile(profile_name, profile_config)
+        _validate_profile(profile_name, profile_config, identity_exists)
 
     return True
 
 
-def _validate_profile(profile_name: str, profile_config: dict) -> bool:
+def _validate_profile(
+    profile_name: str,
+    profile_config: dict,
+    identity_exists: dict[str, bool] | None = None,
+) -> bool:
     """Validate a single profile configuration."""
     # Validate session_name if provided
     session_name = profile_config.get("session_name")
     if session_name is not None:
-        if not isinstance(session_name, str) or not session_name.strip():
+        if (
+            not isinstance(session_name, str)
+            or not session_name
+            or session_name.isspace()
+        ):
             raise ConfigError(
                 f"Profile '{profile_name}' session_name must be a non-empty string"
             )
@@ -379,8 +498,7 @@ def _validate_profile(profile_name: str, profile_config: dict) -> bool:
                 f"Profile '{profile_name}' default_identity must be a string"
             )
 
-        identity_path = Path(default_identity).expanduser()
-        if not identity_path.exists():
+        if not identity_file_exists(default_identity, identity_exists):
             raise ConfigError(
                 f"Profile '{profile_name}' identity file not found:"
                 f" '{default_identity}'"
@@ -396,7 +514,7 @@ def _validate_profile(profile_name: str, profile_config: dict) -> bool:
             raise ConfigError(
                 f"Profile '{profile_name}' commands[{i}] must be a string"
             )
-        if not command.strip():
+        if not command or command.isspace():
             raise ConfigError(f"Profile '{profile_name}' commands[{i}] cannot be empty")
 
     return True
@@ -462,12 +580,20 @@ def create_default_config() -> None:
     if config_file.exists():
         return  # Config already exists
 
-    # Create config with defaults and auto-detected identity
-    config = PortmuxConfig()
-
     # Try to find default identity
     default_identity = get_default_identity()
     if default_identity:
-        config.default_identity = default_identity
+        # A JSON string literal is also a valid TOML basic string
+        identity_line = f"default_identity = {json.dumps(default_identity)}"
+    else:
+        identity_line = '# default_identity = "~/.ssh/id_ed25519"'
 
-    save_config(config)
+    # Every value is a default by construction, so skip the serializer and
+    # validation and write the template directly
+    try:
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        config_file.write_text(
+            _DEFAULT_CONFIG_TEMPLATE.format(identity_line=identity_line)
+        )
+    except OSError as e:
+        raise ConfigError(f"Failed to save config file '{config_file}': {e}")
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 class Output:
@@ -19,7 +21,8 @@ class Output:
     """
 
     def __init__(self, console: Console | None = None):
-        self.console = console or Console()
+        # Messages are already styled explicitly; skip Rich's regex highlighter
+        self.console = console or Console(highlight=False)
 
     def success(self, msg: str) -> None:
         self.console.print(f"[green]{msg}[/green]")
@@ -48,11 +51,31 @@ class Output:
         self.console.print(table)
 
     def panel(self, content: str, **kwargs) -> None:
+        from rich.panel import Panel
+
         self.console.print(Panel(content, **kwargs))
 
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Buffer everything printed inside the block and write it at the end.
+
+        Only wrap quick stretches of messages; anything slow inside the block
+        delays all of its output.
+        """
+        with self.console:
+            yield
+
     @contextmanager
     def progress_context(self) -> Generator[ProgressReporter, None, None]:
-        """Context manager for progress reporting with a spinner."""
+        """Context manager for progress reporting with a spinner.
+
+        When the console is not a terminal (piped or redirected output) a
+        no-op reporter is yielded instead, so no redraw thread is started.
+        """
+        if not self.console.is_terminal:
+            yield NullProgressReporter()
+            return
+
         from rich.progress import Progress, SpinnerColumn, TextColumn
 
         with Progress(
@@ -60,6 +83,7 @@ class Output:
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
             transient=True,
+            refresh_per_second=2,
         ) as progress:
             yield ProgressReporter(progress)
 
@@ -77,8 +101,37 @@ class ProgressReporter:
             self._progress.remove_task(self._current_task)
         self._current_task = self._progress.add_task(description, total=None)
 
+    def track(self, description: str, total: int) -> None:
+        """Start a single task that completes after ``total`` advances."""
+        self.finish()
+        self._current_task = self._progress.add_task(description, total=total)
+
+    def advance(self) -> None:
+        """Advance the current task by one step."""
+        if self._current_task is not None:
+            self._progress.advance(self._current_task)
+
     def finish(self) -> None:
         """Remove the current progress task."""
         if self._current_task is not None:
             self._progress.remove_task(self._current_task)
             self._current_task = None
+
+
+class NullProgressReporter(ProgressReporter):
+    """Progress reporter that discards all updates, for non-terminal output."""
+
+    def __init__(self):
+        super().__init__(None)
+
+    def update(self, description: str) -> None:
+        pass
+
+    def track(self, description: str, total: int) -> None:
+        pass
+
+    def advance(self) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
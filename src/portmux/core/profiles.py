@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 from ..exceptions import ConfigError
 from ..models import PortmuxConfig, ProfileConfig, StartupConfig
-from .config import DEFAULT_PROFILE_CONFIG
+from .config import DEFAULT_PROFILE_CONFIG, identity_file_exists
 
 
 def load_profile(profile_name: str, config: PortmuxConfig) -> PortmuxConfig:
@@ -36,37 +38,27 @@ def load_profile(profile_name: str, config: PortmuxConfig) -> PortmuxConfig:
 
     profile_config = profiles[profile_name]
 
-    # Start with base configuration
-    merged = PortmuxConfig(
-        session_name=config.session_name,
-        default_identity=config.default_identity,
-        reconnect_delay=config.reconnect_delay,
-        max_retries=config.max_retries,
-        startup=StartupConfig(
-            auto_execute=config.startup.auto_execute,
-            commands=list(config.startup.commands),
-        ),
-        profiles=config.profiles,
-    )
-
-    # Apply profile-specific overrides
-    if profile_config.session_name:
-        merged.session_name = profile_config.session_name
-
-    if profile_config.default_identity:
-        merged.default_identity = profile_config.default_identity
-
-    # Add profile-specific startup commands
+    # Profile commands replace the base startup commands
     if profile_config.commands:
-        merged.startup = StartupConfig(
+        startup = StartupConfig(
             auto_execute=True,
             commands=list(profile_config.commands),
         )
+    else:
+        startup = StartupConfig(
+            auto_execute=config.startup.auto_execute,
+            commands=list(config.startup.commands),
+        )
 
-    # Store the active profile name for reference
-    merged.active_profile = profile_name
-
-    return merged
+    # Build the merged config in one step, keeping every base field the
+    # profile doesn't override and recording the active profile name
+    return dataclasses.replace(
+        config,
+        session_name=profile_config.session_name or config.session_name,
+        default_identity=profile_config.default_identity or config.default_identity,
+        startup=startup,
+        active_profile=profile_name,
+    )
 
 
 def list_available_profiles(config: PortmuxConfig) -> list[str]:
@@ -110,9 +102,13 @@ def get_profile_info(config: PortmuxConfig, profile_name: str) -> dict:
     if profile_name not in config.profiles:
         raise ConfigError(f"Profile '{profile_name}' not found")
 
-    profile_config = config.profiles[profile_name]
+    return _profile_info(config, profile_name, config.profiles[profile_name])
 
-    # Build profile information
+
+def _profile_info(
+    config: PortmuxConfig, profile_name: str, profile_config: ProfileConfig
+) -> dict:
+    """Build the get_profile_info() dict for an already looked-up profile."""
     info = {
         "name": profile_name,
         "session_name": profile_config.session_name or config.session_name,
@@ -126,12 +122,18 @@ def get_profile_info(config: PortmuxConfig, profile_name: str) -> dict:
     return info
 
 
-def validate_profile(profile_name: str, profile_config: dict) -> bool:
+def validate_profile(
+    profile_name: str,
+    profile_config: dict,
+    identity_exists: dict[str, bool] | None = None,
+) -> bool:
     """Validate a single profile configuration.
 
     Args:
         profile_name: Name of the profile
         profile_config: Profile configuration dict (raw from TOML)
+        identity_exists: Identity file existence results to reuse and fill in
+            when validating many profiles
 
     Returns:
         True if valid
@@ -161,10 +163,7 @@ def validate_profile(profile_name: str, profile_config: dict) -> bool:
                 f"Profile '{profile_name}' default_identity must be a string"
             )
 
-        from pathlib import Path
-
-        identity_path = Path(default_identity).expanduser()
-        if not identity_path.exists():
+        if not identity_file_exists(default_identity, identity_exists):
             raise ConfigError(
                 f"Profile '{profile_name}' identity file not found:"
                 f" '{default_identity}'"
@@ -215,7 +214,7 @@ def create_profile_template(
     Returns:
         Profile configuration dict
     """
-    profile_config = DEFAULT_PROFILE_CONFIG.copy()
+    profile_config = {**DEFAULT_PROFILE_CONFIG, "commands": []}
 
     if session_name:
         profile_config["session_name"] = session_name
@@ -238,25 +237,21 @@ def profile_summary(config: PortmuxConfig) -> dict:
     Returns:
         Dict with profile summary information
     """
+    profiles = config.profiles
     summary = {
-        "total_profiles": len(config.profiles),
-        "profile_names": list_available_profiles(config),
+        "total_profiles": len(profiles),
+        "profile_names": sorted(profiles),
         "profiles": {},
     }
 
     for profile_name in summary["profile_names"]:
-        try:
-            info = get_profile_info(config, profile_name)
-            summary["profiles"][profile_name] = {
-                "session_name": info["session_name"],
-                "command_count": info["command_count"],
-                "has_custom_identity": not info["inherits_identity"],
-                "has_custom_session": not info["inherits_session_name"],
-            }
-        except ConfigError:
-            summary["profiles"][profile_name] = {
-                "error": "Invalid profile configuration"
-            }
+        info = _profile_info(config, profile_name, profiles[profile_name])
+        summary["profiles"][profile_name] = {
+            "session_name": info["session_name"],
+            "command_count": info["command_count"],
+            "has_custom_identity": not info["inherits_identity"],
+            "has_custom_session": not info["inherits_session_name"],
+        }
 
     return summary
 
@@ -273,30 +268,23 @@ def merge_profile_with_base(
     Returns:
         New PortmuxConfig with profile overrides
     """
-    merged = PortmuxConfig(
-        session_name=base_config.session_name,
-        default_identity=base_config.default_identity,
-        reconnect_delay=base_config.reconnect_delay,
-        max_retries=base_config.max_retries,
-        startup=StartupConfig(
+    # Handle commands specially - replace startup commands
+    if profile_config.commands:
+        startup = StartupConfig(
+            auto_execute=True,
+            commands=list(profile_config.commands),
+        )
+    else:
+        startup = StartupConfig(
             auto_execute=base_config.startup.auto_execute,
             commands=list(base_config.startup.commands),
-        ),
-        profiles=base_config.profiles,
-    )
+        )
 
     # Override base config with profile-specific values
+    overrides = {}
     if profile_config.session_name is not None:
-        merged.session_name = profile_config.session_name
-
+        overrides["session_name"] = profile_config.session_name
     if profile_config.default_identity is not None:
-        merged.default_identity = profile_config.default_identity
-
-    # Handle commands specially - replace startup commands
-    if profile_config.commands:
-        merged.startup = StartupConfig(
-            auto_execute=True,
-            commands=list(profile_config.commands),
-        )
+        overrides["default_identity"] = profile_config.default_identity
 
-    return merged
+    return dataclasses.replace(base_config, startup=startup, **overrides)
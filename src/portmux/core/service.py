@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..backend import TmuxBackend, TunnelBackend
 from ..health.logger import HealthLogger
@@ -12,6 +14,15 @@ from ..models import ForwardInfo, PortmuxConfig
 from ..ssh.forwards import (
     add_forward as _add_forward,
 )
+from ..ssh.forwards import (
+    cancel_multiplexed_forward as _cancel_multiplexed_forward,
+)
+from ..ssh.forwards import (
+    ensure_control_dir as _ensure_control_dir,
+)
+from ..ssh.forwards import (
+    ensure_control_master as _ensure_control_master,
+)
 from ..ssh.forwards import (
     list_forwards as _list_forwards,
 )
@@ -21,6 +32,9 @@ from ..ssh.forwards import (
 from ..ssh.forwards import (
     remove_forward as _remove_forward,
 )
+from ..ssh.forwards import (
+    remove_forwards as _remove_forwards,
+)
 from .config import (
     get_default_identity,
 )
@@ -30,6 +44,9 @@ from .startup import execute_startup_commands, startup_commands_enabled
 
 MONITOR_WINDOW = "_monitor"
 
+# Upper bound on concurrent refreshes; stays under sshd's default MaxStartups (10)
+MAX_REFRESH_WORKERS = 8
+
 
 class PortmuxService:
     """Coordinates operations between config, session, forwards, startup.
@@ -112,6 +129,9 @@ class PortmuxService:
             # Flush so session events precede forward events from startup
             self.logger.flush()
 
+            if self.config.control_master:
+                _ensure_control_dir()
+
             if profile:
                 self.output.info(f"Initialized with profile: {profile}")
 
@@ -174,12 +194,21 @@ class PortmuxService:
         # Initialize session if needed
         self._init_session_if_needed()
 
+        # Share one SSH connection per host across forwards
+        if self.config.control_master:
+            _ensure_control_dir()
+            self.output.verbose(f"Checking control master for {host}...", verbose)
+            if not _ensure_control_master(host, identity):
+                self.output.warning(
+                    f"Could not start control master for {host},"
+                    " forward will use its own connection"
+                )
+
         # Create the forward
-        if verbose:
-            direction_name = "Local" if direction == "L" else "Remote"
-            self.output.info(
-                f"Creating {direction_name.lower()} forward {spec} to {host}..."
-            )
+        direction_name = "local" if direction == "L" else "remote"
+        self.output.verbose(
+            f"Creating {direction_name} forward {spec} to {host}...", verbose
+        )
 
         window_name = _add_forward(
             direction=direction,
@@ -188,44 +217,56 @@ class PortmuxService:
             identity=identity,
             session_name=self.session_name,
             backend=self.backend,
+            multiplex=self.config.control_master,
         )
 
-        direction_name = "Local" if direction == "L" else "Remote"
         self.output.success(
-            f"Successfully created {direction_name.lower()} forward '{window_name}'"
+            f"Successfully created {direction_name} forward '{window_name}'"
         )
         self.logger.info(f"Forward created ({host})", tunnel=window_name)
         self.logger.flush()
 
         return window_name
 
-    def remove_forward(self, name: str, verbose: bool = False) -> bool:
+    def remove_forward(
+        self, name: str, verbose: bool = False, forward: ForwardInfo | None = None
+    ) -> bool:
         """Remove a single forward by name.
 
         Args:
             name: Forward name (e.g., "L:8080:localhost:80")
             verbose: Enable verbose output
+            forward: Already-listed info for the forward, saves a lookup
 
         Returns:
             True if removed
         """
         self.output.verbose(f"Removing forward '{name}'...", verbose)
-        _remove_forward(name, self.session_name, backend=self.backend)
+        # The forward may have been created through a ControlMaster even if
+        # control_master has since been switched off, so always pass its command
+        if forward is None:
+            forward = next((f for f in self.list_forwards() if f.name == name), None)
+        command = forward.command if forward else None
+        _remove_forward(name, self.session_name, backend=self.backend, command=command)
         self.output.success(f"Successfully removed forward '{name}'")
         self.logger.info("Forward removed", tunnel=name)
         self.logger.flush()
         return True
 
-    def remove_all_forwards(self, verbose: bool = False) -> int:
+    def remove_all_forwards(
+        self, verbose: bool = False, forwards: list[ForwardInfo] | None = None
+    ) -> int:
         """Remove all forwards.
 
         Args:
             verbose: Enable verbose output
+            forwards: Already-listed forwards to remove (lists them if None)
 
         Returns:
             Number of forwards removed
         """
-        forwards = self.list_forwards()
+        if forwards is None:
+            forwards = self.list_forwards()
         if not forwards:
             self.output.warning(
                 f"No forwards to remove in session '{self.session_name}'"
@@ -233,16 +274,16 @@ class PortmuxService:
             return 0
 
         removed_count = 0
-        for forward in forwards:
-            try:
-                _remove_forward(forward.name, self.session_name, backend=self.backend)
+        results = _remove_forwards(forwards, self.session_name, backend=self.backend)
+        for name, error in results:
+            if error is None:
                 removed_count += 1
-                self.logger.info("Forward removed", tunnel=forward.name)
+                self.logger.info("Forward removed", tunnel=name)
                 if verbose:
-                    self.output.success(f"Removed forward '{forward.name}'")
-            except Exception as e:
-                self.output.error(f"Failed to remove '{forward.name}': {e}")
-                self.logger.error(f"Failed to remove: {e}", tunnel=forward.name)
+                    self.output.success(f"Removed forward '{name}'")
+            else:
+                self.output.error(f"Failed to remove '{name}': {error}")
+                self.logger.error(f"Failed to remove: {error}", tunnel=name)
 
         self.output.success(f"Successfully removed {removed_count} forward(s)")
         self.logger.info(f"All forwards removed ({removed_count})")
@@ -259,7 +300,11 @@ class PortmuxService:
             True if destroyed
         """
         self.output.verbose(f"Destroying session '{self.session_name}'...", verbose)
+        # Multiplexed forwards live on in their master unless cancelled
+        forwards = self.list_forwards()
         self.backend.kill_session(self.session_name)
+        for forward in forwards:
+            _cancel_multiplexed_forward(forward.command)
         self.output.success(f"Session '{self.session_name}' destroyed successfully")
         self.logger.info(f"Session '{self.session_name}' destroyed")
         self.logger.flush()
@@ -295,13 +340,19 @@ class PortmuxService:
         delay: float | None = None,
         reload_startup: bool = False,
         verbose: bool = False,
+        parallel: int = 4,
     ) -> int:
         """Refresh all forwards.
 
+        Forwards are refreshed concurrently by a bounded worker pool. Each
+        worker waits ``delay`` between the starts of its own refreshes, so
+        starts stay staggered without serializing the SSH handshakes.
+
         Args:
-            delay: Delay between refreshes in seconds
+            delay: Minimum time between refresh starts on one worker, in seconds
             reload_startup: Whether to re-execute startup commands after refresh
             verbose: Enable verbose output
+            parallel: Maximum concurrent refreshes (capped at MAX_REFRESH_WORKERS)
 
         Returns:
             Number of forwards refreshed
@@ -320,29 +371,52 @@ class PortmuxService:
             f"Refreshing all {len(forwards)} forward(s) with {delay}s delay..."
         )
 
-        refreshed_count = 0
-        with self.output.progress_context() as progress:
-            for i, forward in enumerate(forwards):
-                progress.update(f"Refreshing {forward.name} ({i + 1}/{len(forwards)})")
+        # Every worker reuses this listing instead of re-listing the session
+        snapshot = {f.name: f for f in forwards}
+
+        # Starts are only staggered within a worker, so ``delay`` spaces out
+        # each worker's own refreshes without serializing the whole pool
+        worker = threading.local()
+
+        def _refresh(name: str) -> None:
+            last_start = getattr(worker, "last_start", None)
+            if last_start is not None:
+                wait = last_start + delay - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+            worker.last_start = time.monotonic()
+            _refresh_forward(
+                name, self.session_name, backend=self.backend, snapshot=snapshot
+            )
 
+        workers = max(1, min(parallel, MAX_REFRESH_WORKERS, len(forwards)))
+        refreshed_count = 0
+        with (
+            self.output.progress_context() as progress,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            progress.track(f"Refreshing {len(forwards)} forward(s)", len(forwards))
+            futures = {
+                executor.submit(_refresh, forward.name): forward for forward in forwards
+            }
+
+            # Results are reported from this thread only, so output and the
+            # logger buffer are never touched concurrently
+            for future in as_completed(futures):
+                forward = futures[future]
                 try:
-                    _refresh_forward(
-                        forward.name, self.session_name, backend=self.backend
-                    )
+                    future.result()
                     refreshed_count += 1
                     self.logger.info("Forward refreshed", tunnel=forward.name)
                     if verbose:
                         self.output.success(f"Refreshed forward '{forward.name}'")
-
-                    # Add delay between refreshes (except for last one)
-                    if i < len(forwards) - 1 and delay > 0:
-                        time.sleep(delay)
-
                 except Exception as e:
                     self.output.error(f"Failed to refresh '{forward.name}': {e}")
                     self.logger.error(f"Failed to refresh: {e}", tunnel=forward.name)
 
-                progress.finish()
+                progress.advance()
+
+            progress.finish()
 
         self.output.success(
             f"Successfully refreshed {refreshed_count}/{len(forwards)} forward(s)"
@@ -9,6 +9,10 @@ from ..exceptions import ConfigError, PortMuxError
 from ..models import PortmuxConfig, StartupCommand
 from .output import Output
 
+_VALID_SUBCOMMANDS = frozenset(
+    {"add", "remove", "list", "refresh", "status", "profile"}
+)
+
 
 def execute_startup_commands(
     config: PortmuxConfig,
@@ -110,24 +114,21 @@ def execute_startup_command(
 
     try:
         # Build the actual command to execute
+        cmd_args = parsed_command.args
         if parsed_command.command == "portmux":
             # Modify portmux commands to use the correct session
-            cmd_args = parsed_command.args.copy()
-
-            # Add session argument if not already present
             if "--session" not in cmd_args and "-s" not in cmd_args:
-                cmd_args = ["--session", session_name] + cmd_args
+                cmd_args = ["--session", session_name, *cmd_args]
 
-            # Build the full command using the installed portmux script
-            full_command = ["portmux"] + cmd_args
-        else:
-            # For non-portmux commands, execute as-is
-            full_command = shlex.split(command)
+        # Reuse the parsed arguments rather than splitting the command again
+        full_command = [parsed_command.command, *cmd_args]
 
         # Execute the command
+        # stdout is only shown in verbose mode, so don't buffer it otherwise
         result = subprocess.run(
             full_command,
-            capture_output=True,
+            stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=60,  # 60 second timeout for startup commands
         )
@@ -185,10 +186,9 @@ def parse_startup_command(command: str) -> StartupCommand:
         if not args:
             raise ConfigError("PortMUX commands must have subcommands")
 
-        valid_subcommands = ["add", "remove", "list", "refresh", "status", "profile"]
         subcommand = args[0]
 
-        if subcommand not in valid_subcommands:
+        if subcommand not in _VALID_SUBCOMMANDS:
             raise ConfigError(f"Invalid PortMUX subcommand: {subcommand}")
 
     return StartupCommand(
@@ -13,6 +13,10 @@ class SSHError(PortMuxError):
     """Raised when SSH operations fail."""
 
 
+class ForwardNotFoundError(SSHError):
+    """Raised when a named forward does not exist in the session."""
+
+
 class ConfigError(PortMuxError):
     """Raised when configuration is invalid."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedSpec:
     """Parsed port specification."""
 
@@ -90,6 +90,7 @@ class PortmuxConfig:
     default_identity: str | None = None
     reconnect_delay: float = 1
     max_retries: int = 3
+    control_master: bool = False
     startup: StartupConfig = field(default_factory=StartupConfig)
     profiles: dict[str, ProfileConfig] = field(default_factory=dict)
     active_profile: str | None = None
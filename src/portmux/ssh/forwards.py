@@ -2,20 +2,154 @@
 
 from __future__ import annotations
 
-import re
+import functools
+import shlex
+import subprocess
+from pathlib import Path
 
 from ..backend import TmuxBackend, TunnelBackend
-from ..exceptions import SSHError, TmuxError
+from ..exceptions import ForwardNotFoundError, SSHError, TmuxError
 from ..models import ForwardInfo, ParsedSpec
 
+# Seconds an idle ControlMaster connection stays open after its last client
+CONTROL_PERSIST = 600
+
 
 def _default_backend() -> TunnelBackend:
     return TmuxBackend()
 
 
+def get_control_dir() -> Path:
+    """Get the directory holding SSH ControlMaster sockets.
+
+    Returns:
+        Path to the socket directory (~/.portmux/sockets)
+    """
+    return Path.home() / ".portmux" / "sockets"
+
+
+def _control_path() -> str:
+    return f"{get_control_dir()}/%r@%h:%p"
+
+
+def ensure_control_dir() -> Path:
+    """Create the ControlMaster socket directory with owner-only permissions.
+
+    Returns:
+        Path to the socket directory
+    """
+    control_dir = get_control_dir()
+    control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    control_dir.chmod(0o700)
+    return control_dir
+
+
+def ensure_control_master(host: str, identity: str | None = None) -> bool:
+    """Start a background ControlMaster connection to host if none is running.
+
+    Forwards created with multiplexing attach to this master as channels
+    instead of performing their own TCP and authentication handshake.
+
+    Args:
+        host: SSH target like "user@hostname"
+        identity: Path to SSH key file (optional)
+
+    Returns:
+        True if a master is running for host, False if it couldn't be started
+    """
+    control_opts = ["-o", f"ControlPath={_control_path()}"]
+
+    check = subprocess.run(
+        ["ssh", *control_opts, "-O", "check", host],
+        capture_output=True,
+        text=True,
+    )
+    if check.returncode == 0:
+        return True
+
+    master_args = [
+        "ssh",
+        "-M",
+        "-N",
+        "-f",
+        *control_opts,
+        "-o",
+        f"ControlPersist={CONTROL_PERSIST}",
+    ]
+    if identity:
+        master_args.extend(["-i", identity])
+    master_args.append(host)
+
+    # The backgrounded master inherits any pipes it is given, and run() would
+    # wait for it to close them; only the exit status is needed here
+    try:
+        result = subprocess.run(
+            master_args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
+
+
+def cancel_multiplexed_forward(command: str) -> bool:
+    """Cancel a forward held by a ControlMaster connection.
+
+    Forwards requested through a master outlive the client process that
+    asked for them, so killing the tunnel alone leaves the port bound.
+
+    Args:
+        command: SSH command string the forward was started with
+
+    Returns:
+        True if a cancel request was sent and accepted, False otherwise
+    """
+    try:
+        parts = shlex.split(command)
+    except ValueError:
+        return False
+    control_path = next(
+        (p for p in parts if p.startswith("ControlPath=")),
+        None,
+    )
+    if control_path is None or len(parts) < 2:
+        return False
+
+    for flag in ("-L", "-R"):
+        if flag in parts:
+            index = parts.index(flag)
+            if index + 1 < len(parts):
+                spec = parts[index + 1]
+                break
+    else:
+        return False
+
+    try:
+        result = subprocess.run(
+            ["ssh", "-o", control_path, "-O", "cancel", flag, spec, parts[-1]],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
+
+
+def _is_port_digits(value: str) -> bool:
+    return 1 <= len(value) <= 5 and value.isascii() and value.isdecimal()
+
+
+@functools.lru_cache(maxsize=256)
 def parse_port_spec(spec: str) -> ParsedSpec:
     """Validate and parse port specifications.
 
+    Results are cached per spec string, since the same specs are parsed by
+    CLI validation, add_forward and every health check. Invalid specs are
+    not cached and raise on each call.
+
     Args:
         spec: Port specification like "8080:localhost:80" or "9000:192.168.1.10:443"
 
@@ -25,30 +159,38 @@ def parse_port_spec(spec: str) -> ParsedSpec:
     Raises:
         SSHError: If port specification is invalid
     """
-    # Pattern: local_port:remote_host:remote_port
-    pattern = r"^(\d{1,5}):([^:]+):(\d{1,5})$"
-    match = re.match(pattern, spec)
-
-    if not match:
+    # Format: local_port:remote_host:remote_port, split on the outer colons
+    first = spec.find(":")
+    last = spec.rfind(":")
+    local_port_str = spec[:first]
+    remote_host = spec[first + 1 : last]
+    remote_port_str = spec[last + 1 :]
+
+    if (
+        first == last
+        or not remote_host
+        or ":" in remote_host
+        or not _is_port_digits(local_port_str)
+        or not _is_port_digits(remote_port_str)
+    ):
         raise SSHError(
             f"Invalid port specification '{spec}'."
             " Expected format: 'local_port:remote_host:remote_port'"
         )
 
-    local_port_str, remote_host, remote_port_str = match.groups()
+    local_port = int(local_port_str)
+    remote_port = int(remote_port_str)
 
     # Validate port ranges
-    for port_name, port_str in [("local", local_port_str), ("remote", remote_port_str)]:
-        port_num = int(port_str)
-        if not (1 <= port_num <= 65535):
-            raise SSHError(
-                f"Invalid {port_name} port {port_num}. Must be between 1 and 65535"
-            )
+    if not 1 <= local_port <= 65535:
+        raise SSHError(f"Invalid local port {local_port}. Must be between 1 and 65535")
+    if not 1 <= remote_port <= 65535:
+        raise SSHError(
+            f"Invalid remote port {remote_port}. Must be between 1 and 65535"
+        )
 
     return ParsedSpec(
-        local_port=int(local_port_str),
-        remote_host=remote_host,
-        remote_port=int(remote_port_str),
+        local_port=local_port, remote_host=remote_host, remote_port=remote_port
     )
 
 
@@ -59,6 +201,7 @@ def add_forward(
     identity: str | None = None,
     session_name: str = "portmux",
     backend: TunnelBackend | None = None,
+    multiplex: bool = False,
 ) -> str:
     """Create SSH port forward in a new tunnel.
 
@@ -69,6 +212,7 @@ def add_forward(
         identity: Path to SSH key file (optional)
         session_name: Name of the tmux session
         backend: Tunnel backend to use (defaults to TmuxBackend)
+        multiplex: Attach to a ControlMaster connection for host if one exists
 
     Returns:
         Window name created
@@ -84,8 +228,9 @@ def add_forward(
             f"Invalid direction '{direction}'. Must be 'L' (local) or 'R' (remote)"
         )
 
-    # Validate port specification
-    parsed_spec = parse_port_spec(spec)
+    # Validate port specification; a valid spec is already in the
+    # "local:host:remote" form ssh expects, so it is passed through as-is
+    parse_port_spec(spec)
 
     # Create window name
     window_name = f"{direction}:{spec}"
@@ -97,22 +242,26 @@ def add_forward(
     # Build SSH command
     ssh_args = ["ssh", "-N"]
 
-    port_spec_str = (
-        f"{parsed_spec.local_port}:{parsed_spec.remote_host}:{parsed_spec.remote_port}"
-    )
-
     if direction == "L":
-        ssh_args.extend(["-L", port_spec_str])
+        ssh_args.extend(["-L", spec])
     else:  # direction == "R"
-        ssh_args.extend(["-R", port_spec_str])
+        ssh_args.extend(["-R", spec])
 
     if identity:
         ssh_args.extend(["-i", identity])
 
+    if multiplex:
+        # ControlMaster=no: reuse a running master, never become one, so the
+        # tunnel process stays in the foreground of its window
+        ssh_args.extend(
+            ["-o", "ControlMaster=no", "-o", f"ControlPath={_control_path()}"]
+        )
+
     ssh_args.append(host)
 
-    # Create the tunnel with SSH command
-    ssh_command = " ".join(ssh_args)
+    # Create the tunnel with SSH command; quote arguments such as identity
+    # paths with spaces so the window's shell passes them through intact
+    ssh_command = shlex.join(ssh_args)
     backend.create_tunnel(window_name, ssh_command, session_name)
 
     return window_name
@@ -122,6 +271,7 @@ def remove_forward(
     name: str,
     session_name: str = "portmux",
     backend: TunnelBackend | None = None,
+    command: str | None = None,
 ) -> bool:
     """Remove SSH forward by killing its tunnel.
 
@@ -129,6 +279,8 @@ def remove_forward(
         name: Window name (e.g., "L:8080:localhost:80")
         session_name: Name of the tmux session
         backend: Tunnel backend to use (defaults to TmuxBackend)
+        command: SSH command of the forward; multiplexed forwards are
+            also cancelled on their ControlMaster
 
     Returns:
         True if successful
@@ -137,7 +289,39 @@ def remove_forward(
         TmuxError: If tmux operations fail
     """
     backend = backend or _default_backend()
-    return backend.kill_tunnel(name, session_name)
+    killed = backend.kill_tunnel(name, session_name)
+    if command:
+        cancel_multiplexed_forward(command)
+    return killed
+
+
+def remove_forwards(
+    forwards: list[ForwardInfo],
+    session_name: str = "portmux",
+    backend: TunnelBackend | None = None,
+) -> list[tuple[str, Exception | None]]:
+    """Remove several forwards with a single backend call.
+
+    Args:
+        forwards: Forwards to remove, as returned by list_forwards()
+        session_name: Name of the tmux session
+        backend: Tunnel backend to use (defaults to TmuxBackend)
+
+    Returns:
+        (name, error) pairs in input order; error is None on success
+
+    Raises:
+        TmuxError: If the tunnels can't be listed at all
+    """
+    backend = backend or _default_backend()
+    errors = backend.kill_tunnels([f.name for f in forwards], session_name)
+    results = []
+    for forward in forwards:
+        error = errors.get(forward.name)
+        if error is None and forward.command:
+            cancel_multiplexed_forward(forward.command)
+        results.append((forward.name, error))
+    return results
 
 
 def list_forwards(
@@ -157,34 +341,44 @@ def list_forwards(
         TmuxError: If tmux operations fail
     """
     backend = backend or _default_backend()
-    tunnels = backend.list_tunnels(session_name)
-    forwards = []
+    # Forward windows are named "L:<spec>" or "R:<spec>"
+    return [
+        ForwardInfo(
+            name=tunnel.name,
+            direction=tunnel.name[0],
+            spec=tunnel.name[2:],
+            status=tunnel.status,
+            command=tunnel.command,
+        )
+        for tunnel in backend.list_tunnels(session_name)
+        if tunnel.name.startswith(("L:", "R:"))
+    ]
 
-    for tunnel in tunnels:
-        name = tunnel.name
 
-        # Parse window name to extract forward details
-        if ":" in name and name[0] in ("L", "R"):
-            direction = name[0]
-            spec = name[2:]  # Skip "L:" or "R:"
+def snapshot_forwards(
+    session_name: str = "portmux",
+    backend: TunnelBackend | None = None,
+) -> dict[str, ForwardInfo]:
+    """List all active SSH forwards once, keyed by name.
 
-            forwards.append(
-                ForwardInfo(
-                    name=name,
-                    direction=direction,
-                    spec=spec,
-                    status=tunnel.status,
-                    command=tunnel.command,
-                )
-            )
+    Args:
+        session_name: Name of the tmux session
+        backend: Tunnel backend to use (defaults to TmuxBackend)
 
-    return forwards
+    Returns:
+        Dict mapping forward name to ForwardInfo
+
+    Raises:
+        TmuxError: If tmux operations fail
+    """
+    return {f.name: f for f in list_forwards(session_name, backend=backend)}
 
 
 def refresh_forward(
     name: str,
     session_name: str = "portmux",
     backend: TunnelBackend | None = None,
+    snapshot: dict[str, ForwardInfo] | None = None,
 ) -> bool:
     """Remove existing forward and recreate it with same parameters.
 
@@ -192,30 +386,32 @@ def refresh_forward(
         name: Window name (e.g., "L:8080:localhost:80")
         session_name: Name of the tmux session
         backend: Tunnel backend to use (defaults to TmuxBackend)
+        snapshot: Forwards from snapshot_forwards(); skips listing the
+            session again when refreshing many forwards
 
     Returns:
         True if successful
 
     Raises:
-        SSHError: If forward doesn't exist or can't be parsed
+        ForwardNotFoundError: If forward doesn't exist
+        SSHError: If forward can't be parsed
         TmuxError: If tmux operations fail
     """
     backend = backend or _default_backend()
 
     # Get the current forward details before removing it
-    forwards = list_forwards(session_name, backend=backend)
-    current_forward = None
-
-    for forward in forwards:
-        if forward.name == name:
-            current_forward = forward
-            break
+    if snapshot is None:
+        snapshot = snapshot_forwards(session_name, backend=backend)
+    current_forward = snapshot.get(name)
 
     if not current_forward:
-        raise SSHError(f"Forward '{name}' not found")
+        raise ForwardNotFoundError(f"Forward '{name}' not found")
 
     # Parse the current command to extract parameters
-    command_parts = current_forward.command.split()
+    try:
+        command_parts = shlex.split(current_forward.command)
+    except ValueError:
+        command_parts = []
     if len(command_parts) < 2 or command_parts[0] != "ssh":
         raise SSHError(f"Cannot parse SSH command for forward '{name}'")
 
@@ -229,15 +425,27 @@ def refresh_forward(
         if identity_index + 1 < len(command_parts):
             identity = command_parts[identity_index + 1]
 
-    # Remove the current forward
-    remove_forward(name, session_name, backend=backend)
+    # Multiplexed forwards are recreated as channels on the existing master
+    multiplex = any(p.startswith("ControlPath=") for p in command_parts)
+
+    # Remove the current forward, cancelling it on its master if multiplexed
+    # so the port is free to be forwarded again
+    remove_forward(name, session_name, backend=backend, command=current_forward.command)
 
     # Recreate it
     direction = current_forward.direction
     spec = current_forward.spec
 
     try:
-        add_forward(direction, spec, host, identity, session_name, backend=backend)
+        add_forward(
+            direction,
+            spec,
+            host,
+            identity,
+            session_name,
+            backend=backend,
+            multiplex=multiplex,
+        )
         return True
     except (SSHError, TmuxError):
         # If recreation fails, we've already removed the original
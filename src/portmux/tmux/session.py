@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 import libtmux
 from libtmux.exc import LibTmuxException, TmuxCommandNotFound, TmuxSessionExists
 
@@ -23,6 +25,26 @@ def _get_server() -> libtmux.Server:
         raise TmuxError("tmux is not installed or not found in PATH")
 
 
+def _server_running() -> bool:
+    """Cheaply check whether the default tmux server socket exists.
+
+    Resolves the socket the same way the tmux client does: the path in $TMUX
+    when running inside tmux, otherwise $TMUX_TMPDIR (or /tmp) plus
+    tmux-<uid>/default. A missing socket means no server, so callers can skip
+    spawning tmux entirely.
+
+    Returns:
+        False if the socket is definitely absent, True otherwise
+    """
+    tmux_env = os.environ.get("TMUX")
+    if tmux_env:
+        socket_path = tmux_env.split(",", 1)[0]
+    else:
+        tmpdir = os.environ.get("TMUX_TMPDIR") or "/tmp"
+        socket_path = os.path.join(tmpdir, f"tmux-{os.getuid()}", "default")
+    return os.path.exists(socket_path)
+
+
 def create_session(session_name: str = "portmux") -> bool:
     """Create a new tmux session dedicated to port forwards.
 
@@ -59,6 +81,9 @@ def session_exists(session_name: str = "portmux") -> bool:
     Raises:
         TmuxError: If tmux command fails
     """
+    if not _server_running():
+        return False
+
     try:
         server = _get_server()
         return server.has_session(session_name)
@@ -8,7 +8,25 @@ import libtmux
 from libtmux.exc import LibTmuxException, TmuxCommandNotFound
 
 from ..exceptions import TmuxError
-from ..models import TunnelDiagnostics
+from ..models import TunnelDiagnostics, TunnelInfo
+
+# Separates the list-windows fields: a control character, so unlike "|" it
+# doesn't turn up in window names or commands in practice. tmux only passes it
+# through to UTF-8 clients, hence the -u in list_windows.
+_FIELD_SEP = "\x1f"
+
+# One line per window: name, flags and command. The command is the active
+# pane's start command, falling back to its current command.
+_LIST_WINDOWS_FORMAT = _FIELD_SEP.join(
+    [
+        "#{window_name}",
+        "#{window_raw_flags}",
+        "#{?pane_start_command,#{pane_start_command},#{pane_current_command}}",
+    ]
+)
+
+# stderr fragments tmux prints when the target session or server is absent
+_NO_SESSION_ERRORS = ("can't find session", "no server running", "error connecting")
 
 
 def _get_session(session_name: str) -> libtmux.Session | None:
@@ -58,6 +76,9 @@ def create_window(name: str, command: str, session_name: str = "portmux") -> boo
 def kill_window(name: str, session_name: str = "portmux") -> bool:
     """Kill a specific tmux window by name.
 
+    The window is looked up by name and killed by ID, so names containing
+    ``.`` or ``:`` can't be misread as pane or session targets.
+
     Args:
         name: Name of the tmux window to kill
         session_name: Name of the tmux session
@@ -68,31 +89,121 @@ def kill_window(name: str, session_name: str = "portmux") -> bool:
     Raises:
         TmuxError: If tmux command fails
     """
-    try:
-        session = _get_session(session_name)
-        if session is None:
-            return True  # Session gone, window is gone too
-        window = session.windows.get(window_name=name, default=None)
-        if window is None:
-            return True  # Already gone, consider success
-        window.kill()
+    windows = _list_window_ids(session_name)
+    if windows is None:
+        return True  # Session gone, window is gone too
+
+    window_id = next((wid for wid, wname in windows if wname == name), None)
+    if window_id is None:
+        return True  # Already gone, consider success
+
+    result = subprocess.run(
+        ["tmux", "kill-window", "-t", window_id], capture_output=True
+    )
+    if result.returncode == 0:
         return True
-    except TmuxError:
-        raise
-    except LibTmuxException as e:
-        raise TmuxError(f"Failed to kill window '{name}': {e}")
+
+    # stderr is only scanned on failure, where it is usually a single line
+    if b"can't find window" in result.stderr:
+        return True  # Closed between listing and killing
+    stderr = result.stderr.decode(errors="replace").strip()
+    raise TmuxError(f"Failed to kill window '{name}': {stderr}")
+
+
+def _list_window_ids(session_name: str) -> list[tuple[str, str]] | None:
+    """List (window_id, window_name) pairs with one tmux call.
+
+    Returns:
+        The pairs in window order, or None if the session doesn't exist
+
+    Raises:
+        TmuxError: If tmux is not installed or the command fails
+    """
+    try:
+        # -u so non-ASCII names aren't rewritten and still match exactly
+        result = subprocess.run(
+            [
+                "tmux",
+                "-u",
+                "list-windows",
+                "-t",
+                f"={session_name}",
+                "-F",
+                "#{window_id}|#{window_name}",
+            ],
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        raise TmuxError("tmux is not installed or not found in PATH")
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        if any(marker in stderr for marker in _NO_SESSION_ERRORS):
+            return None
+        raise TmuxError(f"Failed to list windows: {stderr}")
+
+    windows = []
+    for line in result.stdout.decode(errors="replace").splitlines():
+        window_id, _, name = line.partition("|")
+        windows.append((window_id, name))
+    return windows
 
 
-def _get_start_command(pane: libtmux.Pane) -> str:
-    """Get the original command used to start a pane.
+def kill_windows(
+    names: list[str], session_name: str = "portmux"
+) -> dict[str, TmuxError | None]:
+    """Kill several windows with one chained tmux invocation.
 
-    Falls back to pane_current_command if start command is unavailable.
+    Windows are targeted by ID so names containing ``.`` or ``:`` can't be
+    misread as pane or session targets. If the chained command fails, each
+    window is retried individually to report per-window errors.
+
+    Args:
+        names: Names of the tmux windows to kill
+        session_name: Name of the tmux session
+
+    Returns:
+        Mapping of window name to None on success, or the TmuxError raised
+
+    Raises:
+        TmuxError: If tmux is not installed or the windows can't be listed
     """
-    cmd = getattr(pane, "pane_start_command", None) or ""
-    # tmux returns start_command quoted, e.g. '"ssh -N -L ..."'
-    if cmd.startswith('"') and cmd.endswith('"'):
-        cmd = cmd[1:-1]
-    return cmd or (pane.pane_current_command or "")
+    if not names:
+        return {}
+
+    windows = _list_window_ids(session_name)
+    if windows is None:
+        return dict.fromkeys(names)  # Session gone, windows are gone too
+
+    wanted = set(names)
+    window_ids = [window_id for window_id, name in windows if name in wanted]
+
+    results: dict[str, TmuxError | None] = dict.fromkeys(names)
+    if not window_ids:
+        return results  # Already gone, consider success
+
+    args = ["tmux"]
+    for window_id in window_ids:
+        if len(args) > 1:
+            args.append(";")
+        args.extend(["kill-window", "-t", window_id])
+
+    if subprocess.run(args, capture_output=True).returncode != 0:
+        # tmux stops at the first failing command; find out which ones failed
+        for name in names:
+            try:
+                kill_window(name, session_name)
+            except TmuxError as e:
+                results[name] = e
+
+    return results
+
+
+def _unquote_command(cmd: str) -> str:
+    """Strip the quotes tmux wraps start commands in, e.g. '"ssh -N -L ..."'."""
+    if len(cmd) >= 2 and cmd.startswith('"') and cmd.endswith('"'):
+        return cmd[1:-1]
+    return cmd
 
 
 def _is_pane_dead(pane: libtmux.Pane, session_name: str, window_name: str) -> bool:
@@ -108,44 +219,71 @@ def _is_pane_dead(pane: libtmux.Pane, session_name: str, window_name: str) -> bo
                 "#{pane_dead}",
             ],
             capture_output=True,
-            text=True,
         )
-        return result.stdout.strip() == "1"
+        return result.stdout.strip() == b"1"
     except Exception:
         return bool(pane.pane_dead_status)
 
 
-def list_windows(session_name: str = "portmux") -> list[dict[str, str]]:
+def list_windows(session_name: str = "portmux") -> list[TunnelInfo]:
     """Get all windows in session with their details.
 
     Args:
         session_name: Name of the tmux session
 
+    Uses a single ``tmux list-windows -F`` call rather than one query per
+    window and pane.
+
     Returns:
-        List of dicts containing window details: name, status, command
+        TunnelInfo per window with its name, status and command
 
     Raises:
         TmuxError: If tmux command fails
     """
     try:
-        session = _get_session(session_name)
-        if session is None:
+        # -u: without a UTF-8 locale tmux rewrites the separator to "_"
+        result = subprocess.run(
+            [
+                "tmux",
+                "-u",
+                "list-windows",
+                "-t",
+                f"={session_name}",
+                "-F",
+                _LIST_WINDOWS_FORMAT,
+            ],
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        raise TmuxError("tmux is not installed or not found in PATH")
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        if any(marker in stderr for marker in _NO_SESSION_ERRORS):
             return []  # Session doesn't exist, return empty list
-        windows = []
-        for window in session.windows:
-            pane = window.active_pane
-            windows.append(
-                {
-                    "name": window.name,
-                    "status": window.window_raw_flags or "",
-                    "command": _get_start_command(pane) if pane else "",
-                }
+        raise TmuxError(f"Failed to list windows: {stderr}")
+
+    # Split the raw bytes and decode each field separately; fields are almost
+    # always ASCII, so this avoids decoding and re-scanning the whole buffer
+    windows = []
+    sep = _FIELD_SEP.encode()
+    for line in result.stdout.split(b"\n"):
+        fields = line.split(sep, 2)
+        if len(fields) != 3:
+            continue  # Blank or malformed line
+        name, status, command = fields
+        windows.append(
+            TunnelInfo(
+                name=name.decode(errors="replace"),
+                status=status.decode("ascii"),
+                command=_unquote_command(command.decode(errors="replace")),
             )
-        return windows
-    except TmuxError:
-        raise
-    except LibTmuxException as e:
-        raise TmuxError(f"Failed to list windows: {e}")
+        )
+
+    if not windows and result.stdout.strip():
+        # Output that can't be split is a format problem, not an empty session
+        raise TmuxError("Failed to list windows: unexpected list-windows output")
+    return windows
 
 
 def window_exists(name: str, session_name: str = "portmux") -> bool:
@@ -161,10 +299,10 @@ def window_exists(name: str, session_name: str = "portmux") -> bool:
     Raises:
         TmuxError: If tmux command fails
     """
-    session = _get_session(session_name)
-    if session is None:
+    windows = _list_window_ids(session_name)
+    if windows is None:
         return False
-    return session.windows.get(window_name=name, default=None) is not None
+    return any(window_name == name for _, window_name in windows)
 
 
 def get_window_diagnostics(
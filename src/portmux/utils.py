@@ -2,34 +2,98 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from typing import TYPE_CHECKING
+
 import click
-from rich.table import Table
 
-from .core.output import Output
-from .exceptions import ConfigError, PortMuxError, SSHError, TmuxError
+from .exceptions import ConfigError, SSHError, TmuxError
 from .models import ForwardInfo
 
+if TYPE_CHECKING:
+    from rich.table import Table
 
-def handle_error(error: PortMuxError, output: Output | None = None) -> None:
-    """Handle and display PortMUX errors with appropriate formatting.
 
-    Args:
-        error: The PortMUX error to handle
-        output: Output channel (creates default if None)
+@functools.cache
+def _init_colorama() -> None:
+    """Initialize colorama once, on the first colored error message.
+
+    Only Windows consoles need the ANSI translation layer; elsewhere it would
+    just wrap stdout/stderr for nothing.
+    """
+    if sys.platform != "win32":
+        return
+
+    import colorama
+
+    colorama.init()
+
+
+class StyledError(click.ClickException):
+    """ClickException printed in PortMUX's error style.
+
+    Click shows it on stderr before exiting with status 1, so error messages
+    never mix with a command's regular (e.g. ``--json``) output.
     """
-    if output is None:
-        output = Output()
 
+    def __init__(self, message: str, label: str = "Error", hint: str | None = None):
+        super().__init__(message)
+        self.label = label
+        self.hint = hint
+
+    def show(self, file=None) -> None:
+        _init_colorama()
+
+        from rich.console import Console
+        from rich.markup import escape
+
+        console = Console(file=file, stderr=file is None, highlight=False)
+        console.print(f"[red]{self.label}: {escape(self.message)}[/red]")
+        if self.hint:
+            console.print(f"[yellow]Hint: {escape(self.hint)}[/yellow]")
+
+
+def handle_error(error: Exception) -> click.ClickException:
+    """Wrap a PortMUX error for Click, labelled by its kind.
+
+    Args:
+        error: The error to report
+
+    Returns:
+        ClickException to raise from the command, e.g. ``raise handle_error(e)``
+    """
+    message = str(error)
     if isinstance(error, TmuxError):
-        output.error(f"Tmux Error: {error}")
-        if "not installed" in str(error):
-            output.warning("Hint: Install tmux with your package manager")
-    elif isinstance(error, SSHError):
-        output.error(f"SSH Error: {error}")
-    elif isinstance(error, ConfigError):
-        output.error(f"Config Error: {error}")
-    else:
-        output.error(f"Error: {error}")
+        hint = None
+        if "not installed" in message:
+            hint = "Install tmux with your package manager"
+        return StyledError(message, "Tmux Error", hint)
+    if isinstance(error, SSHError):
+        return StyledError(message, "SSH Error")
+    if isinstance(error, ConfigError):
+        return StyledError(message, "Config Error")
+    return StyledError(message)
+
+
+_DIRECTION_LABELS = {"L": "Local", "R": "Remote"}
+
+_HEALTH_COLORS = {
+    "healthy": "green",
+    "unhealthy": "red",
+    "starting": "yellow",
+    "restarting": "yellow",
+    "dead": "red bold",
+    "unknown": "dim",
+}
+
+
+def _format_health(health: str | None) -> str:
+    """Render a health state as Rich markup for the status column."""
+    if not health:
+        return "[dim]\u2014[/dim]"
+    color = _HEALTH_COLORS.get(health, "dim")
+    return f"[{color}]{health.title()}[/{color}]"
 
 
 def create_forwards_table(
@@ -44,6 +108,9 @@ def create_forwards_table(
     Returns:
         Rich Table object
     """
+    # Imported here so that plain and --json output never load rich.table
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold blue")
 
     table.add_column("Name", style="cyan")
@@ -52,59 +119,24 @@ def create_forwards_table(
 
     if include_status:
         table.add_column("Status", style="yellow", width=10)
-
-    _health_colors = {
-        "healthy": "green",
-        "unhealthy": "red",
-        "starting": "yellow",
-        "restarting": "yellow",
-        "dead": "red bold",
-        "unknown": "dim",
-    }
-
-    for forward in forwards:
-        direction_display = "Local" if forward.direction == "L" else "Remote"
-
-        row = [forward.name, direction_display, forward.spec]
-
-        if include_status:
-            if forward.health:
-                color = _health_colors.get(forward.health, "dim")
-                status = f"[{color}]{forward.health.title()}[/{color}]"
-            else:
-                status = "[dim]\u2014[/dim]"
-            row.append(status)
-
-        table.add_row(*row)
+        for forward in forwards:
+            table.add_row(
+                forward.name,
+                _DIRECTION_LABELS.get(forward.direction, "Remote"),
+                forward.spec,
+                _format_health(forward.health),
+            )
+    else:
+        for forward in forwards:
+            table.add_row(
+                forward.name,
+                _DIRECTION_LABELS.get(forward.direction, "Remote"),
+                forward.spec,
+            )
 
     return table
 
 
-def validate_direction(direction: str) -> str:
-    """Validate and normalize direction argument.
-
-    Args:
-        direction: Direction string to validate
-
-    Returns:
-        Normalized direction ('L' or 'R')
-
-    Raises:
-        click.BadParameter: If direction is invalid
-    """
-    direction = direction.upper()
-    if direction not in ("L", "R", "LOCAL", "REMOTE"):
-        raise click.BadParameter(
-            f"Invalid direction '{direction}'. Must be 'L'/'LOCAL' or 'R'/'REMOTE'"
-        )
-
-    # Normalize to single letter
-    if direction in ("LOCAL", "L"):
-        return "L"
-    else:  # REMOTE or R
-        return "R"
-
-
 def validate_port_spec(spec: str) -> str:
     """Validate port specification format.
 
@@ -127,6 +159,41 @@ def validate_port_spec(spec: str) -> str:
         raise click.BadParameter(f"Invalid port specification: {e}")
 
 
+_DIRECTION_ALIASES = {"L": "L", "LOCAL": "L", "R": "R", "REMOTE": "R"}
+
+
+class DirectionChoice(click.Choice):
+    """Case-insensitive direction choice that converts to 'L' or 'R'."""
+
+    def __init__(self) -> None:
+        super().__init__(["L", "R", "LOCAL", "REMOTE"], case_sensitive=False)
+
+    def convert(
+        self, value: str, param: click.Parameter | None, ctx: click.Context | None
+    ) -> str:
+        return _DIRECTION_ALIASES[super().convert(value, param, ctx).upper()]
+
+
+DIRECTION_CHOICE = DirectionChoice()
+
+
+class PortSpecParamType(click.ParamType):
+    """Click parameter type that validates a port specification."""
+
+    name = "spec"
+
+    def convert(
+        self, value: str, param: click.Parameter | None, ctx: click.Context | None
+    ) -> str:
+        try:
+            return validate_port_spec(value)
+        except click.BadParameter as e:
+            self.fail(e.message, param, ctx)
+
+
+PORT_SPEC = PortSpecParamType()
+
+
 def confirm_destructive_action(message: str, force: bool = False) -> bool:
     """Confirm destructive actions with user.
 
@@ -69,6 +69,16 @@ class TestTmuxBackendTunnel:
         assert result is True
         mock_kill.assert_called_once_with("L:8080:localhost:80", "portmux")
 
+    @patch("portmux.tmux.windows.kill_windows")
+    def test_kill_tunnels(self, mock_kill):
+        mock_kill.return_value = {"L:8080:localhost:80": None}
+        backend = TmuxBackend()
+
+        result = backend.kill_tunnels(["L:8080:localhost:80"], "portmux")
+
+        assert result == {"L:8080:localhost:80": None}
+        mock_kill.assert_called_once_with(["L:8080:localhost:80"], "portmux")
+
     @patch("portmux.tmux.windows.window_exists")
     def test_tunnel_exists(self, mock_exists):
         mock_exists.return_value = True
@@ -82,8 +92,8 @@ class TestTmuxBackendTunnel:
     @patch("portmux.tmux.windows.list_windows")
     def test_list_tunnels(self, mock_list):
         mock_list.return_value = [
-            {"name": "L:8080:localhost:80", "status": "-", "command": "ssh"},
-            {"name": "R:9000:localhost:9000", "status": "*", "command": "ssh"},
+            TunnelInfo(name="L:8080:localhost:80", status="-", command="ssh"),
+            TunnelInfo(name="R:9000:localhost:9000", status="*", command="ssh"),
         ]
         backend = TmuxBackend()
 
@@ -1,5 +1,6 @@
 """Tests for main CLI interface."""
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -20,6 +21,14 @@ class TestMainCLI:
         assert "remove" in result.output
         assert "refresh" in result.output
 
+    def test_version_output(self):
+        from importlib.metadata import version
+
+        result = CliRunner().invoke(main, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output == f"PortMUX, version {version('portmux')}\n"
+
     def test_global_options_passed_to_context(self):
         CliRunner()
 
@@ -32,3 +41,24 @@ class TestMainCLI:
 
         # This test is more of a design verification
         # Actual context testing would require more complex setup
+
+
+class TestLazyGroup:
+    def test_resolves_every_registered_command(self):
+        ctx = click.Context(main)
+
+        for name in main.list_commands(ctx):
+            command = main.get_command(ctx, name)
+            assert isinstance(command, click.Command)
+            assert command.name == name
+
+    def test_hidden_daemon_command_registered(self):
+        ctx = click.Context(main)
+
+        command = main.get_command(ctx, "_monitor-daemon")
+
+        assert command is not None
+        assert command.hidden is True
+
+    def test_unknown_command(self):
+        assert main.get_command(click.Context(main), "nope") is None
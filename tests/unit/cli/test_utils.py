@@ -4,33 +4,86 @@ from unittest.mock import patch
 
 import click
 import pytest
+from click.testing import CliRunner
 
+from portmux.exceptions import SSHError, TmuxError
 from portmux.models import ForwardInfo
 from portmux.utils import (
+    DIRECTION_CHOICE,
+    StyledError,
+    _init_colorama,
     confirm_destructive_action,
     create_forwards_table,
-    validate_direction,
+    handle_error,
     validate_port_spec,
 )
 
 
-class TestValidateDirection:
+class TestDirectionChoice:
     def test_valid_directions(self):
-        assert validate_direction("L") == "L"
-        assert validate_direction("R") == "R"
-        assert validate_direction("l") == "L"
-        assert validate_direction("r") == "R"
-        assert validate_direction("LOCAL") == "L"
-        assert validate_direction("REMOTE") == "R"
-        assert validate_direction("local") == "L"
-        assert validate_direction("remote") == "R"
+        assert DIRECTION_CHOICE.convert("L", None, None) == "L"
+        assert DIRECTION_CHOICE.convert("R", None, None) == "R"
+        assert DIRECTION_CHOICE.convert("l", None, None) == "L"
+        assert DIRECTION_CHOICE.convert("r", None, None) == "R"
+        assert DIRECTION_CHOICE.convert("LOCAL", None, None) == "L"
+        assert DIRECTION_CHOICE.convert("REMOTE", None, None) == "R"
+        assert DIRECTION_CHOICE.convert("local", None, None) == "L"
+        assert DIRECTION_CHOICE.convert("remote", None, None) == "R"
 
     def test_invalid_direction(self):
         with pytest.raises(click.BadParameter):
-            validate_direction("X")
+            DIRECTION_CHOICE.convert("X", None, None)
 
         with pytest.raises(click.BadParameter):
-            validate_direction("INVALID")
+            DIRECTION_CHOICE.convert("INVALID", None, None)
+
+
+class TestInitColorama:
+    def setup_method(self):
+        _init_colorama.cache_clear()
+
+    def teardown_method(self):
+        _init_colorama.cache_clear()
+
+    @patch("colorama.init")
+    def test_skipped_off_windows(self, mock_init):
+        with patch("portmux.utils.sys.platform", "linux"):
+            _init_colorama()
+        mock_init.assert_not_called()
+
+    @patch("colorama.init")
+    def test_initialized_on_windows(self, mock_init):
+        with patch("portmux.utils.sys.platform", "win32"):
+            _init_colorama()
+            _init_colorama()
+        mock_init.assert_called_once()
+
+
+class TestHandleError:
+    def test_returns_labelled_error(self):
+        exc = handle_error(SSHError("boom"))
+
+        assert isinstance(exc, StyledError)
+        assert exc.message == "boom"
+        assert exc.label == "SSH Error"
+        assert exc.exit_code == 1
+
+    def test_tmux_not_installed_hint(self):
+        exc = handle_error(TmuxError("tmux is not installed or not found in PATH"))
+
+        assert exc.label == "Tmux Error"
+        assert exc.hint == "Install tmux with your package manager"
+
+    def test_error_shown_on_stderr(self):
+        @click.command()
+        def fail():
+            raise handle_error(SSHError("boom"))
+
+        result = CliRunner().invoke(fail)
+
+        assert result.exit_code == 1
+        assert result.stdout == ""
+        assert "SSH Error: boom" in result.stderr
 
 
 class TestValidatePortSpec:
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
 from portmux.commands.add import add
@@ -14,6 +15,12 @@ class TestAddCommand:
     def setup_method(self):
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def no_tunnel_wait(self):
+        # Skip the pause before the post-add connection check
+        with patch("portmux.commands.add.time.sleep") as mock_sleep:
+            yield mock_sleep
+
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.tmux.session.create_session")
     @patch("portmux.core.service._add_forward")
@@ -98,8 +105,32 @@ class TestAddCommand:
             },
         )
 
-        assert result.exit_code != 0
-        assert "Invalid direction" in result.output
+        assert result.exit_code == 2
+        assert "'X' is not one of" in result.output
+
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._add_forward")
+    @patch("portmux.commands.add.load_config")
+    def test_add_long_direction_normalized(
+        self, mock_load_config, mock_add_forward, mock_session_exists
+    ):
+        mock_load_config.return_value = PortmuxConfig(default_identity=None)
+        mock_add_forward.return_value = "R:9000:localhost:9000"
+        mock_session_exists.return_value = True
+
+        result = self.runner.invoke(
+            add,
+            ["remote", "9000:localhost:9000", "user@host", "-i", "/path/to/key"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert mock_add_forward.call_args.kwargs["direction"] == "R"
 
     def test_add_invalid_port_spec(self):
         result = self.runner.invoke(
@@ -116,6 +147,23 @@ class TestAddCommand:
         assert result.exit_code != 0
         assert "Invalid port specification" in result.output
 
+    @patch("portmux.commands.add.load_config")
+    def test_add_port_out_of_range_rejected_before_load(self, mock_load_config):
+        result = self.runner.invoke(
+            add,
+            ["L", "70000:localhost:80", "user@host"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid local port 70000" in result.output
+        mock_load_config.assert_not_called()
+
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._add_forward")
     @patch("portmux.commands.add.load_config")
@@ -139,8 +187,9 @@ class TestAddCommand:
             },
         )
 
-        assert result.exit_code != 0
+        assert result.exit_code == 1
         assert "already exists" in result.output
+        assert result.output.count("already exists") == 1
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._add_forward")
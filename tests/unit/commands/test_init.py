@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
 from portmux.commands.init import init
@@ -13,6 +14,13 @@ class TestInitCommand:
     def setup_method(self):
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.touch()
+        with patch("portmux.commands.init.get_config_path", return_value=path):
+            yield path
+
     @patch("portmux.tmux.windows.window_exists")
     @patch("portmux.tmux.windows.create_window")
     @patch("portmux.tmux.session.session_exists")
@@ -122,14 +130,13 @@ class TestInitCommand:
         mock_session_exists,
         mock_create_window,
         mock_win_exists,
+        config_file,
     ):
         mock_session_exists.return_value = False
         mock_win_exists.return_value = False
         mock_create_window.return_value = True
-        mock_load_config.side_effect = [
-            Exception("Config not found"),
-            PortmuxConfig(session_name="portmux"),
-        ]
+        mock_load_config.return_value = PortmuxConfig(session_name="portmux")
+        config_file.unlink()
 
         with patch("portmux.tmux.session.create_session") as mock_create_session:
             mock_create_session.return_value = True
@@ -147,8 +154,33 @@ class TestInitCommand:
 
             assert result.exit_code == 0
             mock_create_config.assert_called_once()
+            mock_load_config.assert_called_once_with(None)
             assert "Default configuration created" in result.output
 
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.commands.init.load_config")
+    @patch("portmux.commands.init.create_default_config")
+    def test_init_existing_config_not_recreated(
+        self, mock_create_config, mock_load_config, mock_session_exists
+    ):
+        mock_session_exists.return_value = True
+        mock_load_config.return_value = PortmuxConfig(session_name="portmux")
+
+        result = self.runner.invoke(
+            init,
+            [],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        mock_create_config.assert_not_called()
+        assert "Default configuration created" not in result.output
+
     @patch("portmux.tmux.windows.window_exists")
     @patch("portmux.tmux.windows.create_window")
     @patch("portmux.tmux.session.session_exists")
@@ -154,3 +154,52 @@ class TestListCommand:
         assert output_data["session"] == "portmux"
         assert output_data["active"] is False
         assert output_data["forwards"] == []
+
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.commands.list.load_config")
+    def test_list_json_compact_by_default(
+        self, mock_load_config, mock_list_forwards, mock_session_exists
+    ):
+        mock_session_exists.return_value = True
+        mock_load_config.return_value = PortmuxConfig()
+        mock_list_forwards.return_value = []
+
+        result = self.runner.invoke(
+            list_cmd,
+            ["--json"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert result.output.count("\n") == 1
+
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.commands.list.load_config")
+    def test_list_json_pretty(
+        self, mock_load_config, mock_list_forwards, mock_session_exists
+    ):
+        mock_session_exists.return_value = True
+        mock_load_config.return_value = PortmuxConfig()
+        mock_list_forwards.return_value = []
+
+        result = self.runner.invoke(
+            list_cmd,
+            ["--json", "--pretty"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert '\n  "session": "portmux"' in result.output
+        assert json.loads(result.output)["active"] is True
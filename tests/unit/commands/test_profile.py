@@ -15,15 +15,11 @@ class TestProfileListCommand:
         self.runner = CliRunner()
 
     @patch("portmux.commands.profile.load_config")
-    @patch("portmux.commands.profile.list_available_profiles")
     @patch("portmux.commands.profile.profile_summary")
-    def test_profile_list_success(
-        self, mock_summary, mock_list_profiles, mock_load_config
-    ):
+    def test_profile_list_success(self, mock_summary, mock_load_config):
         mock_load_config.return_value = PortmuxConfig(
             profiles={"dev": ProfileConfig(), "prod": ProfileConfig()}
         )
-        mock_list_profiles.return_value = ["dev", "prod"]
         mock_summary.return_value = {
             "total_profiles": 2,
             "profile_names": ["dev", "prod"],
@@ -53,12 +49,11 @@ class TestProfileListCommand:
         assert "Available Profiles" in result.output
         assert "dev" in result.output
         assert "prod" in result.output
+        mock_summary.assert_called_once()
 
     @patch("portmux.commands.profile.load_config")
-    @patch("portmux.commands.profile.list_available_profiles")
-    def test_profile_list_empty(self, mock_list_profiles, mock_load_config):
+    def test_profile_list_empty(self, mock_load_config):
         mock_load_config.return_value = PortmuxConfig(profiles={})
-        mock_list_profiles.return_value = []
 
         result = self.runner.invoke(
             profile,
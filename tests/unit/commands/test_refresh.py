@@ -1,11 +1,13 @@
 """Tests for refresh command."""
 
+import threading
 from unittest.mock import patch
 
 from click.testing import CliRunner
 
 from portmux.commands.refresh import refresh
 from portmux.core.output import Output
+from portmux.exceptions import ForwardNotFoundError
 from portmux.models import ForwardInfo, PortmuxConfig
 
 
@@ -75,13 +77,20 @@ class TestRefreshCommand:
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._list_forwards")
+    @patch("portmux.core.service._refresh_forward")
     @patch("portmux.commands.refresh.load_config")
     def test_refresh_forward_not_found(
-        self, mock_load_config, mock_list_forwards, mock_session_exists
+        self,
+        mock_load_config,
+        mock_refresh_forward,
+        mock_list_forwards,
+        mock_session_exists,
     ):
         mock_session_exists.return_value = True
         mock_load_config.return_value = PortmuxConfig()
-        mock_list_forwards.return_value = []
+        mock_refresh_forward.side_effect = ForwardNotFoundError(
+            "Forward 'L:8080:localhost:80' not found"
+        )
 
         result = self.runner.invoke(
             refresh,
@@ -97,15 +106,19 @@ class TestRefreshCommand:
         assert result.exit_code == 0
         assert "not found" in result.output
         assert "portmux list" in result.output
+        # Existence is checked by refresh_forward, not by a separate listing
+        mock_list_forwards.assert_not_called()
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._list_forwards")
     @patch("portmux.core.service._refresh_forward")
     @patch("portmux.commands.refresh.load_config")
-    @patch("time.sleep")
+    @patch("portmux.core.service.time.monotonic", return_value=100.0)
+    @patch("portmux.core.service.time.sleep")
     def test_refresh_all_forwards(
         self,
         mock_sleep,
+        mock_monotonic,
         mock_load_config,
         mock_refresh_forward,
         mock_list_forwards,
@@ -133,7 +146,7 @@ class TestRefreshCommand:
 
         result = self.runner.invoke(
             refresh,
-            ["--all"],
+            ["--all", "-j", "1"],
             obj={
                 "session": "portmux",
                 "config": None,
@@ -145,9 +158,117 @@ class TestRefreshCommand:
         assert result.exit_code == 0
         assert "Successfully refreshed 2/2 forward(s)" in result.output
         assert mock_refresh_forward.call_count == 2
-        # Should sleep between refreshes (but not after the last one)
+        # One worker sleeps between its refreshes (but not before the first)
         mock_sleep.assert_called_once_with(1)
 
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.core.service._refresh_forward")
+    @patch("portmux.commands.refresh.load_config")
+    def test_refresh_all_parallel_partial_failure(
+        self,
+        mock_load_config,
+        mock_refresh_forward,
+        mock_list_forwards,
+        mock_session_exists,
+    ):
+        mock_session_exists.return_value = True
+        mock_list_forwards.return_value = [
+            ForwardInfo(
+                name=f"L:{port}:localhost:80",
+                direction="L",
+                spec=f"{port}:localhost:80",
+                status="",
+                command="ssh",
+            )
+            for port in (8080, 8081, 8082)
+        ]
+
+        def fake_refresh(name, *args, **kwargs):
+            if name == "L:8081:localhost:80":
+                raise RuntimeError("boom")
+            return True
+
+        mock_refresh_forward.side_effect = fake_refresh
+        mock_load_config.return_value = PortmuxConfig(reconnect_delay=0)
+
+        result = self.runner.invoke(
+            refresh,
+            ["--all", "-j", "3"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert "Failed to refresh 'L:8081:localhost:80': boom" in result.output
+        assert "Successfully refreshed 2/3 forward(s)" in result.output
+        assert mock_refresh_forward.call_count == 3
+
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.core.service._refresh_forward")
+    @patch("portmux.commands.refresh.load_config")
+    @patch("portmux.core.service.time.monotonic", return_value=100.0)
+    @patch("portmux.core.service.time.sleep")
+    def test_refresh_all_parallel_does_not_serialize_starts(
+        self,
+        mock_sleep,
+        mock_monotonic,
+        mock_load_config,
+        mock_refresh_forward,
+        mock_list_forwards,
+        mock_session_exists,
+    ):
+        mock_session_exists.return_value = True
+        mock_list_forwards.return_value = [
+            ForwardInfo(
+                name=f"L:{port}:localhost:80",
+                direction="L",
+                spec=f"{port}:localhost:80",
+                status="",
+                command="ssh",
+            )
+            for port in (8080, 8081, 8082, 8083)
+        ]
+        # Every refresh waits for the others, so each runs on its own worker
+        barrier = threading.Barrier(4, timeout=5)
+        mock_refresh_forward.side_effect = lambda *args, **kwargs: barrier.wait()
+        mock_load_config.return_value = PortmuxConfig(reconnect_delay=2)
+
+        result = self.runner.invoke(
+            refresh,
+            ["--all", "-j", "4"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert mock_refresh_forward.call_count == 4
+        # The delay only spaces out starts on the same worker
+        mock_sleep.assert_not_called()
+
+    def test_refresh_parallel_out_of_range(self):
+        result = self.runner.invoke(
+            refresh,
+            ["--all", "-j", "20"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code != 0
+
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._list_forwards")
     @patch("portmux.core.service._refresh_forward")
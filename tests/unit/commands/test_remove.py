@@ -6,6 +6,7 @@ from click.testing import CliRunner
 
 from portmux.commands.remove import remove
 from portmux.core.output import Output
+from portmux.exceptions import TmuxError
 from portmux.models import ForwardInfo, PortmuxConfig
 
 
@@ -52,6 +53,8 @@ class TestRemoveCommand:
         assert "Successfully removed forward" in result.output
         mock_remove_forward.assert_called_once()
         assert mock_remove_forward.call_args.args == ("L:8080:localhost:80", "portmux")
+        # Passed even with control_master off, so a multiplexed forward is cancelled
+        assert mock_remove_forward.call_args.kwargs["command"] == "ssh"
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.commands.remove.load_config")
@@ -101,7 +104,7 @@ class TestRemoveCommand:
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.core.service._list_forwards")
-    @patch("portmux.core.service._remove_forward")
+    @patch("portmux.core.service._remove_forwards")
     @patch("portmux.commands.remove.confirm_destructive_action")
     @patch("portmux.commands.remove.load_config")
     def test_remove_all_with_confirmation(
@@ -131,7 +134,10 @@ class TestRemoveCommand:
             ),
         ]
         mock_confirm.return_value = True
-        mock_remove_forward.return_value = True
+        mock_remove_forward.return_value = [
+            ("L:8080:localhost:80", None),
+            ("R:9000:localhost:9000", None),
+        ]
 
         result = self.runner.invoke(
             remove,
@@ -146,18 +152,89 @@ class TestRemoveCommand:
 
         assert result.exit_code == 0
         assert "Successfully removed 2 forward(s)" in result.output
-        assert mock_remove_forward.call_count == 2
+        mock_remove_forward.assert_called_once()
+        assert mock_remove_forward.call_args[0][0] == mock_list_forwards.return_value
+        mock_list_forwards.assert_called_once()
+
+    @patch("portmux.tmux.session.session_exists")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.core.service._remove_forwards")
+    @patch("portmux.commands.remove.confirm_destructive_action")
+    @patch("portmux.commands.remove.load_config")
+    def test_remove_all_reports_partial_failure(
+        self,
+        mock_load_config,
+        mock_confirm,
+        mock_remove_forward,
+        mock_list_forwards,
+        mock_session_exists,
+    ):
+        mock_session_exists.return_value = True
+        mock_load_config.return_value = PortmuxConfig()
+        mock_list_forwards.return_value = [
+            ForwardInfo(
+                name="L:8080:localhost:80",
+                direction="L",
+                spec="8080:localhost:80",
+                status="",
+                command="ssh",
+            ),
+            ForwardInfo(
+                name="R:9000:localhost:9000",
+                direction="R",
+                spec="9000:localhost:9000",
+                status="",
+                command="ssh",
+            ),
+        ]
+        mock_confirm.return_value = True
+        mock_remove_forward.return_value = [
+            ("L:8080:localhost:80", None),
+            ("R:9000:localhost:9000", TmuxError("window busy")),
+        ]
+
+        result = self.runner.invoke(
+            remove,
+            ["--all"],
+            obj={
+                "session": "portmux",
+                "config": None,
+                "verbose": False,
+                "output": Output(),
+            },
+        )
+
+        assert result.exit_code == 0
+        assert "Failed to remove 'R:9000:localhost:9000': window busy" in result.output
+        assert "Successfully removed 1 forward(s)" in result.output
 
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.tmux.session.kill_session")
+    @patch("portmux.core.service._list_forwards")
+    @patch("portmux.core.service._cancel_multiplexed_forward")
     @patch("portmux.commands.remove.confirm_destructive_action")
     @patch("portmux.commands.remove.load_config")
     def test_destroy_session_with_confirmation(
-        self, mock_load_config, mock_confirm, mock_kill_session, mock_session_exists
+        self,
+        mock_load_config,
+        mock_confirm,
+        mock_cancel,
+        mock_list_forwards,
+        mock_kill_session,
+        mock_session_exists,
     ):
         mock_session_exists.return_value = True
         mock_load_config.return_value = PortmuxConfig()
         mock_confirm.return_value = True
+        mock_list_forwards.return_value = [
+            ForwardInfo(
+                name="L:8080:localhost:80",
+                direction="L",
+                spec="8080:localhost:80",
+                status="",
+                command="ssh -o ControlPath=/sockets/%r@%h:%p -L 8080:localhost:80 h",
+            )
+        ]
         mock_kill_session.return_value = True
 
         result = self.runner.invoke(
@@ -174,6 +251,9 @@ class TestRemoveCommand:
         assert result.exit_code == 0
         assert "destroyed successfully" in result.output
         mock_kill_session.assert_called_once_with("portmux")
+        mock_cancel.assert_called_once_with(
+            "ssh -o ControlPath=/sockets/%r@%h:%p -L 8080:localhost:80 h"
+        )
 
     def test_remove_no_arguments(self):
         result = self.runner.invoke(
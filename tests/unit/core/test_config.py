@@ -1,11 +1,16 @@
 """Simplified tests for configuration management functions."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open
 
 import pytest
 
+try:
+    import tomllib
+except ModuleNotFoundError:
+    import tomli as tomllib
+
 from portmux.core.config import (
+    create_default_config,
     get_default_identity,
     load_config,
     validate_config,
@@ -51,6 +56,37 @@ class TestValidateConfig:
         ):
             validate_config(config)
 
+    def test_validate_config_invalid_control_master(self):
+        config = {"session_name": "portmux", "control_master": "yes"}
+
+        with pytest.raises(ConfigError, match="'control_master' must be a boolean"):
+            validate_config(config)
+
+    def test_validate_config_shared_identity_checked_once(self, tmp_path, mocker):
+        key = tmp_path / "id_ed25519"
+        key.touch()
+        config = {
+            "general": {"session_name": "portmux", "default_identity": str(key)},
+            "profiles": {
+                name: {"default_identity": str(key)} for name in ("a", "b", "c")
+            },
+        }
+        mock_exists = mocker.patch.object(Path, "exists", return_value=True)
+
+        assert validate_config(config) is True
+        mock_exists.assert_called_once()
+
+    def test_validate_config_sees_identity_created_later(self, tmp_path):
+        key = tmp_path / "id_ed25519"
+        config = {"session_name": "portmux", "default_identity": str(key)}
+
+        with pytest.raises(ConfigError, match="identity file not found"):
+            validate_config(config)
+
+        # Existence results don't outlive a single validation
+        key.touch()
+        assert validate_config(config) is True
+
 
 class TestLoadConfigBasic:
     def test_load_config_file_not_exists(self, mocker):
@@ -68,21 +104,11 @@ class TestLoadConfigBasic:
         assert result.startup == StartupConfig(auto_execute=True, commands=[])
         assert result.profiles == {}
 
-    def test_load_config_success(self, mocker):
-        config_content = 'session_name = "custom-session"'
-
-        # Mock file operations
-        mock_get_config_path = mocker.patch("portmux.core.config.get_config_path")
-        mock_config_file = MagicMock()
-        mock_config_file.exists.return_value = True
-        mock_get_config_path.return_value = mock_config_file
-
-        # Mock open and toml.load
-        mock_open_func = mock_open(read_data=config_content)
-        mock_toml_load = mocker.patch("toml.load")
-        mock_toml_load.return_value = {"session_name": "custom-session"}
+    def test_load_config_success(self, mocker, tmp_path):
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('session_name = "custom-session"\n')
+        mocker.patch("portmux.core.config.get_config_path", return_value=config_file)
 
-        mocker.patch("builtins.open", mock_open_func)
         result = load_config()
 
         assert isinstance(result, PortmuxConfig)
@@ -92,26 +118,120 @@ class TestLoadConfigBasic:
         assert result.profiles == {}
 
 
+class TestLoadConfigCache:
+    def test_repeated_load_parses_once(self, tmp_path, mocker):
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[general]\nsession_name = "cached"\n')
+        toml_load = mocker.patch("portmux.core.config.tomllib.load", wraps=tomllib.load)
+
+        first = load_config(str(config_file))
+        second = load_config(str(config_file))
+
+        assert first.session_name == second.session_name == "cached"
+        assert first is not second
+        toml_load.assert_called_once()
+
+    def test_edited_file_is_reloaded(self, tmp_path):
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[general]\nsession_name = "before"\n')
+        assert load_config(str(config_file)).session_name == "before"
+
+        config_file.write_text('[general]\nsession_name = "after-edit"\n')
+
+        assert load_config(str(config_file)).session_name == "after-edit"
+
+    def test_mutating_result_does_not_leak(self, tmp_path):
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[general]\nsession_name = "original"\n')
+
+        load_config(str(config_file)).session_name = "mutated"
+
+        assert load_config(str(config_file)).session_name == "original"
+
+    def test_relative_path_follows_cwd(self, tmp_path, monkeypatch):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "config.toml").write_text(
+                f'[general]\nsession_name = "{name}"\n'
+            )
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert load_config("config.toml").session_name == "a"
+        monkeypatch.chdir(tmp_path / "b")
+        assert load_config("config.toml").session_name == "b"
+
+
 class TestGetDefaultIdentitySimple:
-    def test_get_default_identity_found(self, mocker):
-        # Mock Path.home to return a test directory
-        mock_home = mocker.patch("pathlib.Path.home")
-        mock_home.return_value = Path("/home/testuser")
+    def setup_method(self):
+        get_default_identity.cache_clear()
+
+    def teardown_method(self):
+        get_default_identity.cache_clear()
+
+    def test_get_default_identity_found(self, mocker, tmp_path):
+        ssh_dir = tmp_path / ".ssh"
+        ssh_dir.mkdir()
+        (ssh_dir / "id_rsa").touch()
+        (ssh_dir / "id_ed25519").touch()
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
 
-        # Mock the exists method for the specific path we expect
-        mocker.patch.object(Path, "exists", side_effect=lambda: True)
         result = get_default_identity()
 
-        # Should return the first identity file found
-        assert result == "/home/testuser/.ssh/id_ed25519"
+        # Should return the first identity file found in preference order
+        assert result == str(ssh_dir / "id_ed25519")
 
-    def test_get_default_identity_none_found(self, mocker):
-        # Mock Path.home to return a test directory
-        mock_home = mocker.patch("pathlib.Path.home")
-        mock_home.return_value = Path("/home/testuser")
+    def test_get_default_identity_none_found(self, mocker, tmp_path):
+        ssh_dir = tmp_path / ".ssh"
+        ssh_dir.mkdir()
+        (ssh_dir / "known_hosts").touch()
+        (ssh_dir / "id_rsa").mkdir()  # Directories don't count
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
 
-        # Mock exists to always return False
-        mocker.patch.object(Path, "exists", return_value=False)
-        result = get_default_identity()
+        assert get_default_identity() is None
+
+    def test_get_default_identity_no_ssh_dir(self, mocker, tmp_path):
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+
+        assert get_default_identity() is None
+
+    def test_get_default_identity_cached(self, mocker, tmp_path):
+        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        mock_scandir = mocker.patch(
+            "portmux.core.config.os.scandir", side_effect=FileNotFoundError
+        )
+
+        get_default_identity()
+        get_default_identity()
+
+        mock_scandir.assert_called_once()
+
+
+class TestCreateDefaultConfig:
+    def test_written_file_loads_as_defaults(self, mocker, tmp_path):
+        config_file = tmp_path / ".portmux" / "config.toml"
+        mocker.patch("portmux.core.config.get_config_path", return_value=config_file)
+        mocker.patch("portmux.core.config.get_default_identity", return_value=None)
+
+        create_default_config()
+
+        assert load_config(str(config_file)) == PortmuxConfig()
+
+    def test_detected_identity_is_written(self, mocker, tmp_path):
+        config_file = tmp_path / "config.toml"
+        key = tmp_path / 'my "key"'
+        key.touch()
+        mocker.patch("portmux.core.config.get_config_path", return_value=config_file)
+        mocker.patch("portmux.core.config.get_default_identity", return_value=str(key))
+
+        create_default_config()
+
+        assert load_config(str(config_file)).default_identity == str(key)
+
+    def test_existing_file_untouched(self, mocker, tmp_path):
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("# mine\n")
+        mocker.patch("portmux.core.config.get_config_path", return_value=config_file)
+
+        create_default_config()
 
-        assert result is None
+        assert config_file.read_text() == "# mine\n"
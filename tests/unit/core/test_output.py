@@ -0,0 +1,41 @@
+"""Tests for the centralized output channel."""
+
+import io
+
+from rich.console import Console
+
+from portmux.core.output import NullProgressReporter, Output, ProgressReporter
+
+
+class TestProgressContext:
+    def test_non_terminal_uses_null_reporter(self):
+        output = Output(Console(file=io.StringIO(), force_terminal=False))
+
+        with output.progress_context() as progress:
+            progress.track("Refreshing", 2)
+            progress.advance()
+            progress.finish()
+
+        assert isinstance(progress, NullProgressReporter)
+        assert output.console.file.getvalue() == ""
+
+    def test_terminal_uses_rich_progress(self):
+        output = Output(Console(file=io.StringIO(), force_terminal=True))
+
+        with output.progress_context() as progress:
+            progress.update("Working")
+
+        assert type(progress) is ProgressReporter
+
+
+class TestBatch:
+    def test_output_written_once_on_exit(self):
+        stream = io.StringIO()
+        output = Output(Console(file=stream, force_terminal=False))
+
+        with output.batch():
+            output.info("first")
+            output.success("second")
+            assert stream.getvalue() == ""
+
+        assert stream.getvalue() == "first\nsecond\n"
@@ -17,7 +17,12 @@ from portmux.core.profiles import (
     validate_profile,
 )
 from portmux.exceptions import ConfigError
-from portmux.models import PortmuxConfig, ProfileConfig, StartupConfig
+from portmux.models import (
+    MonitorConfig,
+    PortmuxConfig,
+    ProfileConfig,
+    StartupConfig,
+)
 
 
 def _config(**kwargs):
@@ -65,6 +70,16 @@ class TestLoadProfile:
         assert result.default_identity == "~/.ssh/id_rsa"  # Inherited
         assert result.startup.commands == ["portmux add L 3000:localhost:3000 user@dev"]
 
+    def test_load_profile_keeps_monitor_config(self):
+        config = _config(
+            monitor=MonitorConfig(enabled=False, check_interval=5.0),
+            profiles={"dev": ProfileConfig(session_name="portmux-dev")},
+        )
+
+        result = load_profile("dev", config)
+
+        assert result.monitor == config.monitor
+
     def test_load_profile_not_found(self):
         config = _config(
             session_name="portmux",
@@ -255,13 +270,13 @@ class TestGetProfileInfo:
 
 
 class TestValidateProfile:
-    @patch("pathlib.Path.exists")
-    def test_validate_profile_valid(self, mock_exists):
-        mock_exists.return_value = True
+    def test_validate_profile_valid(self, tmp_path):
+        key = tmp_path / "dev_key"
+        key.touch()
 
         profile_config = {
             "session_name": "portmux-dev",
-            "default_identity": "~/.ssh/dev_key",
+            "default_identity": str(key),
             "commands": ["portmux add L 3000:localhost:3000 user@dev"],
         }
 
@@ -309,15 +324,26 @@ class TestValidateProfile:
         ):
             validate_profile("dev", profile_config)
 
-    @patch("pathlib.Path.exists")
-    def test_validate_profile_identity_not_found(self, mock_exists):
-        mock_exists.return_value = False
+    def test_validate_profile_identity_not_found(self, tmp_path):
+        missing = tmp_path / "nonexistent_key"
 
-        profile_config = {"default_identity": "~/.ssh/nonexistent_key", "commands": []}
+        profile_config = {"default_identity": str(missing), "commands": []}
 
         with pytest.raises(ConfigError, match="Profile 'dev' identity file not found"):
             validate_profile("dev", profile_config)
 
+    @patch("pathlib.Path.exists")
+    def test_validate_profile_reuses_identity_results(self, mock_exists):
+        mock_exists.return_value = True
+        profile_config = {"default_identity": "~/.ssh/id_rsa", "commands": []}
+        seen = {}
+
+        validate_profile("dev", profile_config, seen)
+        validate_profile("prod", profile_config, seen)
+
+        mock_exists.assert_called_once()
+        assert seen == {"~/.ssh/id_rsa": True}
+
     def test_validate_profile_invalid_commands_type(self):
         profile_config = {"commands": "not a list"}
 
@@ -369,6 +395,7 @@ class TestCreateProfileTemplate:
         result = create_profile_template("dev")
 
         assert result == DEFAULT_PROFILE_CONFIG
+        assert result["commands"] is not DEFAULT_PROFILE_CONFIG["commands"]
 
     def test_create_profile_template_complete(self):
         result = create_profile_template(
@@ -431,16 +458,6 @@ class TestProfileSummary:
         assert result["profile_names"] == []
         assert result["profiles"] == {}
 
-    def test_profile_summary_invalid_profile(self):
-        config = _config(profiles={"dev": ProfileConfig(commands=[])})
-
-        with patch("portmux.core.profiles.get_profile_info") as mock_get_info:
-            mock_get_info.side_effect = ConfigError("Invalid profile")
-
-            result = profile_summary(config)
-
-            assert result["profiles"]["dev"]["error"] == "Invalid profile configuration"
-
 
 class TestMergeProfileWithBase:
     def test_merge_profile_with_base_complete(self):
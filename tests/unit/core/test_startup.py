@@ -166,6 +166,22 @@ class TestExecuteStartupCommand:
         called_args = mock_run.call_args[0][0]
         assert called_args == ["echo", "hello world"]
 
+    @patch("portmux.core.startup.subprocess.run")
+    def test_execute_command_discards_stdout_when_quiet(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout=None, stderr="")
+
+        execute_startup_command("echo hi", "test-session", verbose=False)
+
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+
+    @patch("portmux.core.startup.subprocess.run")
+    def test_execute_command_captures_stdout_when_verbose(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="hi", stderr="")
+
+        execute_startup_command("echo hi", "test-session", verbose=True)
+
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.PIPE
+
     @patch("portmux.core.startup.subprocess.run")
     def test_execute_command_failure(self, mock_run):
         mock_run.return_value = MagicMock(
@@ -4,6 +4,7 @@ service logging, monitor flush."""
 import asyncio
 from unittest.mock import Mock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from portmux.backend import TmuxBackend
@@ -197,6 +198,7 @@ class TestServiceLogging:
         backend = Mock(spec=TmuxBackend)
         backend.session_exists.return_value = True
         backend.tunnel_exists.return_value = False
+        backend.list_tunnels.return_value = []
         backend.create_session.return_value = True
         backend.create_tunnel.return_value = True
         svc = PortmuxService(config, Output(), "portmux", backend=backend)
@@ -279,7 +281,7 @@ class TestServiceLogging:
         content = log_file.read_text()
         assert "Background monitor started" in content
 
-    @patch("portmux.core.service._remove_forward")
+    @patch("portmux.core.service._remove_forwards")
     @patch("portmux.core.service._list_forwards")
     def test_remove_all_logs(self, mock_list, mock_remove, tmp_path):
         mock_list.return_value = [
@@ -291,6 +293,7 @@ class TestServiceLogging:
                 command="",
             )
         ]
+        mock_remove.return_value = [("L:8080:localhost:80", None)]
         svc, log_file = self._make_service(tmp_path)
 
         svc.remove_all_forwards()
@@ -499,6 +502,13 @@ class TestInitWithMonitorEnabled:
     def setup_method(self):
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.touch()
+        with patch("portmux.commands.init.get_config_path", return_value=path):
+            yield path
+
     @patch("portmux.tmux.session.session_exists")
     @patch("portmux.tmux.session.create_session")
     @patch("portmux.tmux.windows.window_exists")
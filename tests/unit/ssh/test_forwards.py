@@ -1,14 +1,18 @@
 """Tests for SSH forwarding functions."""
 
-from unittest.mock import Mock
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
 from portmux.backend import TmuxBackend
-from portmux.exceptions import SSHError, TmuxError
+from portmux.exceptions import ForwardNotFoundError, SSHError, TmuxError
 from portmux.models import ForwardInfo, ParsedSpec, TunnelInfo
 from portmux.ssh.forwards import (
     add_forward,
+    cancel_multiplexed_forward,
+    ensure_control_master,
     list_forwards,
     parse_port_spec,
     refresh_forward,
@@ -83,6 +87,29 @@ class TestParsePortSpec:
         ):
             parse_port_spec("abc:localhost:80")
 
+    def test_parse_empty_host(self):
+        with pytest.raises(
+            SSHError,
+            match="Invalid port specification '8080::80'",
+        ):
+            parse_port_spec("8080::80")
+
+    def test_parse_port_too_many_digits(self):
+        with pytest.raises(
+            SSHError,
+            match="Invalid port specification '123456:localhost:80'",
+        ):
+            parse_port_spec("123456:localhost:80")
+
+    def test_parse_non_ascii_digits(self):
+        with pytest.raises(SSHError, match="Invalid port specification"):
+            parse_port_spec("\u0668\u0660:localhost:80")
+
+    def test_parse_result_is_cached(self):
+        assert parse_port_spec("8080:localhost:80") is parse_port_spec(
+            "8080:localhost:80"
+        )
+
 
 class TestAddForward:
     def _make_backend(self, tunnel_exists=False, create_tunnel=True):
@@ -128,6 +155,19 @@ class TestAddForward:
             "portmux",
         )
 
+    def test_add_forward_quotes_identity_with_spaces(self):
+        backend = self._make_backend()
+
+        add_forward(
+            "L", "8080:localhost:80", "user@host", "/my keys/id", backend=backend
+        )
+
+        backend.create_tunnel.assert_called_once_with(
+            "L:8080:localhost:80",
+            "ssh -N -L 8080:localhost:80 -i '/my keys/id' user@host",
+            "portmux",
+        )
+
     def test_add_forward_custom_session(self):
         backend = self._make_backend()
 
@@ -150,6 +190,22 @@ class TestAddForward:
             "custom-session",
         )
 
+    @patch("portmux.ssh.forwards.get_control_dir")
+    def test_add_forward_multiplexed(self, mock_control_dir):
+        mock_control_dir.return_value = Path("/home/user/.portmux/sockets")
+        backend = self._make_backend()
+
+        add_forward(
+            "L", "8080:localhost:80", "user@host", backend=backend, multiplex=True
+        )
+
+        backend.create_tunnel.assert_called_once_with(
+            "L:8080:localhost:80",
+            "ssh -N -L 8080:localhost:80 -o ControlMaster=no"
+            " -o ControlPath=/home/user/.portmux/sockets/%r@%h:%p user@host",
+            "portmux",
+        )
+
     def test_add_forward_invalid_direction(self):
         with pytest.raises(
             SSHError,
@@ -268,6 +324,7 @@ class TestListForwards:
             TunnelInfo(name="bash-window", status="-", command="bash"),
             TunnelInfo(name="X:invalid", status="-", command="ssh"),
             TunnelInfo(name="no-colon", status="-", command="ssh"),
+            TunnelInfo(name="Logs:tail", status="-", command="tail"),
         ]
 
         result = list_forwards(backend=backend)
@@ -313,11 +370,71 @@ class TestRefreshForward:
             "portmux",
         )
 
+    def test_refresh_forward_with_quoted_identity(self):
+        command = "ssh -N -L 8080:localhost:80 -i '/my keys/id' user@host"
+        backend = self._make_backend_with_forward(command=command)
+
+        result = refresh_forward("L:8080:localhost:80", backend=backend)
+
+        assert result is True
+        backend.create_tunnel.assert_called_once_with(
+            "L:8080:localhost:80", command, "portmux"
+        )
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    @patch("portmux.ssh.forwards.get_control_dir")
+    def test_refresh_forward_keeps_multiplexing(self, mock_control_dir, mock_run):
+        mock_control_dir.return_value = Path("/sockets")
+        mock_run.return_value = Mock(returncode=0)
+        command = (
+            "ssh -N -L 8080:localhost:80 -o ControlMaster=no"
+            " -o ControlPath=/sockets/%r@%h:%p user@host"
+        )
+        backend = self._make_backend_with_forward(command=command)
+
+        result = refresh_forward("L:8080:localhost:80", backend=backend)
+
+        assert result is True
+        # The old forward is cancelled on the master before it is re-forwarded
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][-5:] == [
+            "-O",
+            "cancel",
+            "-L",
+            "8080:localhost:80",
+            "user@host",
+        ]
+        backend.create_tunnel.assert_called_once_with(
+            "L:8080:localhost:80", command, "portmux"
+        )
+
+    def test_refresh_forward_uses_snapshot(self):
+        backend = self._make_backend_with_forward()
+        snapshot = {
+            "L:8080:localhost:80": ForwardInfo(
+                name="L:8080:localhost:80",
+                direction="L",
+                spec="8080:localhost:80",
+                status="-",
+                command="ssh -N -L 8080:localhost:80 user@host",
+            )
+        }
+
+        result = refresh_forward(
+            "L:8080:localhost:80", backend=backend, snapshot=snapshot
+        )
+
+        assert result is True
+        backend.list_tunnels.assert_not_called()
+        backend.create_tunnel.assert_called_once()
+
     def test_refresh_forward_not_found(self):
         backend = Mock(spec=TmuxBackend)
         backend.list_tunnels.return_value = []
 
-        with pytest.raises(SSHError, match="Forward 'L:8080:localhost:80' not found"):
+        with pytest.raises(
+            ForwardNotFoundError, match="Forward 'L:8080:localhost:80' not found"
+        ):
             refresh_forward("L:8080:localhost:80", backend=backend)
 
     def test_refresh_forward_invalid_command(self):
@@ -355,3 +472,96 @@ class TestRefreshForward:
 
         with pytest.raises(SSHError, match="Failed to add"):
             refresh_forward("L:8080:localhost:80", backend=backend)
+
+
+class TestControlMaster:
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_ensure_control_master_already_running(self, mock_run):
+        mock_run.return_value = Mock(returncode=0)
+
+        assert ensure_control_master("user@host") is True
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][-3:] == ["-O", "check", "user@host"]
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_ensure_control_master_starts_master(self, mock_run):
+        mock_run.side_effect = [Mock(returncode=255), Mock(returncode=0)]
+
+        assert ensure_control_master("user@host", "/path/to/key") is True
+        master_args = mock_run.call_args.args[0]
+        assert master_args[:4] == ["ssh", "-M", "-N", "-f"]
+        assert "ControlPersist=600" in master_args
+        assert master_args[-3:] == ["-i", "/path/to/key", "user@host"]
+        # Output pipes would keep run() waiting on the backgrounded master
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+        assert mock_run.call_args.kwargs["stderr"] is subprocess.DEVNULL
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_ensure_control_master_start_fails(self, mock_run):
+        mock_run.side_effect = [Mock(returncode=255), Mock(returncode=255)]
+
+        assert ensure_control_master("user@host") is False
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_cancel_multiplexed_forward(self, mock_run):
+        mock_run.return_value = Mock(returncode=0)
+
+        result = cancel_multiplexed_forward(
+            "ssh -N -L 8080:localhost:80 -o ControlMaster=no"
+            " -o ControlPath=/sockets/%r@%h:%p user@host"
+        )
+
+        assert result is True
+        mock_run.assert_called_once_with(
+            [
+                "ssh",
+                "-o",
+                "ControlPath=/sockets/%r@%h:%p",
+                "-O",
+                "cancel",
+                "-L",
+                "8080:localhost:80",
+                "user@host",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_cancel_multiplexed_forward_timeout(self, mock_run):
+        mock_run.side_effect = subprocess.TimeoutExpired("ssh", 10)
+
+        result = cancel_multiplexed_forward(
+            "ssh -N -L 8080:localhost:80 -o ControlPath=/sockets/%r@%h:%p user@host"
+        )
+
+        assert result is False
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_cancel_multiplexed_forward_quoted_args(self, mock_run):
+        mock_run.return_value = Mock(returncode=0)
+
+        result = cancel_multiplexed_forward(
+            "ssh -N -L 8080:localhost:80 -i '/my keys/id' -o ControlMaster=no"
+            " -o 'ControlPath=/home/a b/.portmux/sockets/%r@%h:%p' user@host"
+        )
+
+        assert result is True
+        assert mock_run.call_args.args[0] == [
+            "ssh",
+            "-o",
+            "ControlPath=/home/a b/.portmux/sockets/%r@%h:%p",
+            "-O",
+            "cancel",
+            "-L",
+            "8080:localhost:80",
+            "user@host",
+        ]
+
+    @patch("portmux.ssh.forwards.subprocess.run")
+    def test_cancel_skips_plain_forward(self, mock_run):
+        result = cancel_multiplexed_forward("ssh -N -L 8080:localhost:80 user@host")
+
+        assert result is False
+        mock_run.assert_not_called()
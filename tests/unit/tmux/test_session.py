@@ -1,12 +1,18 @@
 """Tests for session management functions."""
 
+import os
 from unittest.mock import MagicMock
 
 import pytest
 from libtmux.exc import LibTmuxException, TmuxSessionExists
 
 from portmux.exceptions import TmuxError
-from portmux.tmux.session import create_session, kill_session, session_exists
+from portmux.tmux.session import (
+    _server_running,
+    create_session,
+    kill_session,
+    session_exists,
+)
 
 
 class TestCreateSession:
@@ -62,6 +68,19 @@ class TestCreateSession:
 
 
 class TestSessionExists:
+    @pytest.fixture(autouse=True)
+    def server_running(self, mocker):
+        return mocker.patch("portmux.tmux.session._server_running", return_value=True)
+
+    def test_session_exists_no_server_skips_tmux(self, mocker, server_running):
+        server_running.return_value = False
+        mock_get_server = mocker.patch("portmux.tmux.session._get_server")
+
+        result = session_exists("test-session")
+
+        assert result is False
+        mock_get_server.assert_not_called()
+
     def test_session_exists_true(self, mocker):
         mock_server = MagicMock()
         mock_server.has_session.return_value = True
@@ -112,6 +131,30 @@ class TestSessionExists:
         assert result is False
 
 
+class TestServerRunning:
+    def test_uses_tmux_env_socket(self, mocker, tmp_path):
+        socket = tmp_path / "sock"
+        socket.touch()
+        mocker.patch.dict("os.environ", {"TMUX": f"{socket},1234,0"})
+
+        assert _server_running() is True
+
+    def test_missing_default_socket(self, mocker, tmp_path):
+        mocker.patch.dict("os.environ", {"TMUX_TMPDIR": str(tmp_path)})
+        os.environ.pop("TMUX", None)
+
+        assert _server_running() is False
+
+    def test_existing_default_socket(self, mocker, tmp_path):
+        socket_dir = tmp_path / f"tmux-{os.getuid()}"
+        socket_dir.mkdir()
+        (socket_dir / "default").touch()
+        mocker.patch.dict("os.environ", {"TMUX_TMPDIR": str(tmp_path)})
+        os.environ.pop("TMUX", None)
+
+        assert _server_running() is True
+
+
 class TestKillSession:
     def test_kill_session_success(self, mocker):
         mock_session = MagicMock()
@@ -5,19 +5,14 @@ from unittest.mock import MagicMock
 import pytest
 
 from portmux.exceptions import TmuxError
-from portmux.tmux.windows import create_window, kill_window, list_windows, window_exists
-
-
-def _make_window(name, flags="", command="ssh"):
-    """Create a mock libtmux Window."""
-    window = MagicMock()
-    window.name = name
-    window.window_raw_flags = flags
-    pane = MagicMock()
-    pane.pane_current_command = command
-    pane.pane_start_command = command
-    window.active_pane = pane
-    return window
+from portmux.models import TunnelInfo
+from portmux.tmux.windows import (
+    create_window,
+    kill_window,
+    kill_windows,
+    list_windows,
+    window_exists,
+)
 
 
 class TestCreateWindow:
@@ -71,51 +66,85 @@ class TestCreateWindow:
             create_window("test-window", "echo test")
 
 
+def _list_result(stdout="", returncode=0, stderr=""):
+    """Create a mock CompletedProcess for tmux list-windows (bytes output)."""
+    return MagicMock(
+        returncode=returncode, stdout=stdout.encode(), stderr=stderr.encode()
+    )
+
+
 class TestKillWindow:
     def test_kill_window_success(self, mocker):
-        mock_window = MagicMock()
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = mock_window
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[_list_result("@1|bash\n@2|test-window\n"), _list_result()],
+        )
 
         result = kill_window("test-window")
 
         assert result is True
-        mock_window.kill.assert_called_once()
+        assert mock_run.call_args_list[1][0][0] == ["tmux", "kill-window", "-t", "@2"]
 
     def test_kill_window_custom_session(self, mocker):
-        mock_window = MagicMock()
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = mock_window
-        mock_get = mocker.patch(
-            "portmux.tmux.windows._get_session", return_value=mock_session
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[_list_result("@1|test-window\n"), _list_result()],
         )
 
         result = kill_window("test-window", "custom-session")
 
         assert result is True
-        mock_get.assert_called_once_with("custom-session")
+        assert "=custom-session" in mock_run.call_args_list[0][0][0]
 
     def test_kill_window_not_found(self, mocker):
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = None
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("@1|bash\n"),
+        )
 
         result = kill_window("test-window")
 
         assert result is True  # Already gone, consider success
+        mock_run.assert_called_once()
 
     def test_kill_window_session_gone(self, mocker):
-        mocker.patch("portmux.tmux.windows._get_session", return_value=None)
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(returncode=1, stderr="can't find session: x"),
+        )
 
         result = kill_window("test-window")
 
         assert result is True  # Session gone, window is gone too
 
+    def test_kill_window_closed_before_kill(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[
+                _list_result("@2|test-window\n"),
+                _list_result(returncode=1, stderr="can't find window: @2"),
+            ],
+        )
+
+        assert kill_window("test-window") is True
+
+    def test_kill_window_failure(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[
+                _list_result("@2|test-window\n"),
+                _list_result(returncode=1, stderr="boom"),
+            ],
+        )
+
+        with pytest.raises(
+            TmuxError, match="Failed to kill window 'test-window': boom"
+        ):
+            kill_window("test-window")
+
     def test_kill_window_tmux_not_found(self, mocker):
         mocker.patch(
-            "portmux.tmux.windows._get_session",
-            side_effect=TmuxError("tmux is not installed or not found in PATH"),
+            "portmux.tmux.windows.subprocess.run", side_effect=FileNotFoundError
         )
 
         with pytest.raises(
@@ -124,69 +153,191 @@ class TestKillWindow:
             kill_window("test-window")
 
 
+class TestKillWindows:
+    def test_kills_matching_windows_in_one_call(self, mocker):
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[
+                _list_result("@1|bash\n@2|L:8080:10.0.0.1:80\n@3|R:9000:h:9000\n"),
+                _list_result(),
+            ],
+        )
+
+        result = kill_windows(["L:8080:10.0.0.1:80", "R:9000:h:9000"], "test")
+
+        assert result == {"L:8080:10.0.0.1:80": None, "R:9000:h:9000": None}
+        assert mock_run.call_args_list[1][0][0] == [
+            "tmux",
+            "kill-window",
+            "-t",
+            "@2",
+            ";",
+            "kill-window",
+            "-t",
+            "@3",
+        ]
+
+    def test_session_missing_counts_as_removed(self, mocker):
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(returncode=1, stderr="can't find session: test"),
+        )
+
+        assert kill_windows(["L:1:h:2"], "test") == {"L:1:h:2": None}
+        mock_run.assert_called_once()
+
+    def test_chain_failure_falls_back_per_window(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            side_effect=[
+                _list_result("@1|a\n@2|b\n"),
+                _list_result(returncode=1, stderr="boom"),
+            ],
+        )
+        error = TmuxError("Failed to kill window 'b': boom")
+
+        def fake_kill(name, session_name):
+            if name == "b":
+                raise error
+            return True
+
+        mocker.patch("portmux.tmux.windows.kill_window", side_effect=fake_kill)
+
+        assert kill_windows(["a", "b"], "test") == {"a": None, "b": error}
+
+    def test_empty_names_skips_tmux(self, mocker):
+        mock_run = mocker.patch("portmux.tmux.windows.subprocess.run")
+
+        assert kill_windows([], "test") == {}
+        mock_run.assert_not_called()
+
+
 class TestListWindows:
     def test_list_windows_success(self, mocker):
-        mock_session = MagicMock()
-        mock_session.windows = [
-            _make_window("L:8080:localhost:80", "-", "ssh"),
-            _make_window("R:9000:localhost:9000", "*", "ssh"),
-        ]
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(
+                "L:8080:localhost:80\x1f-\x1fssh\nR:9000:localhost:9000\x1f*\x1fssh\n"
+            ),
+        )
 
         result = list_windows()
 
         expected = [
-            {"name": "L:8080:localhost:80", "status": "-", "command": "ssh"},
-            {"name": "R:9000:localhost:9000", "status": "*", "command": "ssh"},
+            TunnelInfo(name="L:8080:localhost:80", status="-", command="ssh"),
+            TunnelInfo(name="R:9000:localhost:9000", status="*", command="ssh"),
         ]
         assert result == expected
+        mock_run.assert_called_once()
 
     def test_list_windows_empty(self, mocker):
-        mock_session = MagicMock()
-        mock_session.windows = []
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run", return_value=_list_result("")
+        )
 
         result = list_windows()
 
         assert result == []
 
     def test_list_windows_custom_session(self, mocker):
-        mock_session = MagicMock()
-        mock_session.windows = [_make_window("test-window", "-", "bash")]
-        mock_get = mocker.patch(
-            "portmux.tmux.windows._get_session", return_value=mock_session
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("test-window\x1f-\x1fbash\n"),
         )
 
         result = list_windows("custom-session")
 
-        expected = [{"name": "test-window", "status": "-", "command": "bash"}]
+        expected = [TunnelInfo(name="test-window", status="-", command="bash")]
         assert result == expected
-        mock_get.assert_called_once_with("custom-session")
+        args = mock_run.call_args.args[0]
+        assert args[:5] == ["tmux", "-u", "list-windows", "-t", "=custom-session"]
+
+    def test_list_windows_strips_quotes_and_keeps_pipes(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result('test\x1f-\x1f"ssh -N host | tee log"\n'),
+        )
+
+        result = list_windows()
+
+        assert result == [
+            TunnelInfo(name="test", status="-", command="ssh -N host | tee log")
+        ]
+
+    def test_list_windows_keeps_pipes_in_names(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("a|b\x1f*\x1fzsh\n"),
+        )
+
+        result = list_windows()
+
+        assert result == [TunnelInfo(name="a|b", status="*", command="zsh")]
+
+    def test_list_windows_unparseable_output(self, mocker):
+        # e.g. a non-UTF-8 client where tmux rewrites the separator to "_"
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("test_-_bash\n"),
+        )
+
+        with pytest.raises(TmuxError, match="unexpected list-windows output"):
+            list_windows()
+
+    def test_list_windows_skips_malformed_lines(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("garbage\nonly\x1f-\ntest\x1f-\x1fbash\n"),
+        )
+
+        result = list_windows()
+
+        assert result == [TunnelInfo(name="test", status="-", command="bash")]
+
+    def test_list_windows_decodes_non_ascii_names(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("café\x1f-\x1fzsh\n"),
+        )
+
+        result = list_windows()
+
+        assert result == [TunnelInfo(name="café", status="-", command="zsh")]
 
     def test_list_windows_session_not_found(self, mocker):
-        mocker.patch("portmux.tmux.windows._get_session", return_value=None)
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(
+                returncode=1, stderr="can't find session: portmux\n"
+            ),
+        )
 
         result = list_windows()
 
         assert result == []  # Session doesn't exist, return empty list
 
-    def test_list_windows_no_active_pane(self, mocker):
-        mock_window = MagicMock()
-        mock_window.name = "test"
-        mock_window.window_raw_flags = ""
-        mock_window.active_pane = None
-        mock_session = MagicMock()
-        mock_session.windows = [mock_window]
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+    def test_list_windows_no_server(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(
+                returncode=1, stderr="no server running on /tmp/tmux-0/default\n"
+            ),
+        )
 
-        result = list_windows()
+        assert list_windows() == []
 
-        assert result == [{"name": "test", "status": "", "command": ""}]
+    def test_list_windows_other_failure(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(returncode=1, stderr="bad format\n"),
+        )
+
+        with pytest.raises(TmuxError, match="Failed to list windows: bad format"):
+            list_windows()
 
     def test_list_windows_tmux_not_found(self, mocker):
         mocker.patch(
-            "portmux.tmux.windows._get_session",
-            side_effect=TmuxError("tmux is not installed or not found in PATH"),
+            "portmux.tmux.windows.subprocess.run", side_effect=FileNotFoundError
         )
 
         with pytest.raises(
@@ -197,43 +348,52 @@ class TestListWindows:
 
 class TestWindowExists:
     def test_window_exists_true(self, mocker):
-        mock_window = MagicMock()
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = mock_window
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("@1|bash\n@2|L:8080:localhost:80\n"),
+        )
 
         result = window_exists("L:8080:localhost:80")
 
         assert result is True
-        mock_session.windows.get.assert_called_once_with(
-            window_name="L:8080:localhost:80", default=None
-        )
+        mock_run.assert_called_once()
 
     def test_window_exists_false(self, mocker):
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = None
-        mocker.patch("portmux.tmux.windows._get_session", return_value=mock_session)
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("@1|bash\n"),
+        )
 
         result = window_exists("nonexistent")
 
         assert result is False
 
     def test_window_exists_custom_session(self, mocker):
-        mock_window = MagicMock()
-        mock_session = MagicMock()
-        mock_session.windows.get.return_value = mock_window
-        mock_get = mocker.patch(
-            "portmux.tmux.windows._get_session", return_value=mock_session
+        mock_run = mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result("@1|test-window\n"),
         )
 
         result = window_exists("test-window", "custom-session")
 
         assert result is True
-        mock_get.assert_called_once_with("custom-session")
+        assert "=custom-session" in mock_run.call_args[0][0]
 
     def test_window_exists_session_gone(self, mocker):
-        mocker.patch("portmux.tmux.windows._get_session", return_value=None)
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(returncode=1, stderr="can't find session: x"),
+        )
 
         result = window_exists("any-window")
 
         assert result is False
+
+    def test_window_exists_tmux_error(self, mocker):
+        mocker.patch(
+            "portmux.tmux.windows.subprocess.run",
+            return_value=_list_result(returncode=1, stderr="boom"),
+        )
+
+        with pytest.raises(TmuxError, match="Failed to list windows: boom"):
+            window_exists("any-window")